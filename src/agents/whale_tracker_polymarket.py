@@ -16,22 +16,60 @@ Setup:
     3. Configure settings below
 """
 
-import os
+import re
 import sys
+import socket
+import signal
 import time
-import json
 import pandas as pd
 import websocket
 import threading
+import queue
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timedelta
 from pathlib import Path
 from termcolor import cprint
 
+# msgspec decodes straight from bytes into typed objects - no intermediate
+# dict, no per-field .get or float() casts. Optional: the dict path below
+# still works when it isn't installed.
+try:
+    import msgspec
+
+    class OrdersMatchedPayload(msgspec.Struct):
+        """Typed view of a Polymarket orders_matched payload"""
+        price: float = 0.0
+        size: float = 0.0
+        eventSlug: str = ''
+        title: str = 'Unknown'
+        trader: str = 'Unknown'
+        side: str = ''
+
+    class WSEnvelope(msgspec.Struct):
+        """Typed view of a Polymarket WebSocket envelope"""
+        type: str = ''
+        topic: str = ''
+        payload: OrdersMatchedPayload | None = None
+
+    # strict=False lets msgspec coerce the string-encoded prices/sizes
+    # Polymarket sends into floats during the decode pass
+    _ws_decoder = msgspec.json.Decoder(WSEnvelope, strict=False)
+    _ws_decode_error = msgspec.DecodeError
+except ImportError:
+    msgspec = None
+    _ws_decoder = None
+    _ws_decode_error = ValueError
+
 # Add project root to path
 project_root = str(Path(__file__).parent.parent.parent)
 if project_root not in sys.path:
     sys.path.insert(0, project_root)
 
+# Persistence layer - journals, Parquet snapshots, replay and CSV export
+# all live in the storage module (export_csv re-exported for convenience).
+# _loads/_dumps are the shared orjson-or-stdlib JSON codecs.
+from src.agents.whale_tracker_storage import WhaleStore, export_csv, _loads, _dumps
+
 # Import Moon Dev's Polymarket functions
 from src.nice_funcs_polymarket import (
     get_market_by_slug,
@@ -59,15 +97,21 @@ AUTO_COPY_ENABLED = False  # Set to True to automatically copy whale trades
 MAX_POSITION_SIZE = 100  # Maximum USD to risk per trade when copying
 COPY_PERCENTAGE = 10  # Copy 10% of whale's position size
 
-# Data Paths
-DATA_FOLDER = os.path.join(project_root, "src/data/polymarket_whales")
-WHALE_TRADES_CSV = os.path.join(DATA_FOLDER, "whale_trades.csv")
-WHALE_WALLETS_CSV = os.path.join(DATA_FOLDER, "whale_wallets.csv")
-COPY_SIGNALS_CSV = os.path.join(DATA_FOLDER, "copy_signals.csv")
-
 # WebSocket URL
 WEBSOCKET_URL = "wss://ws-live-data.polymarket.com"
 
+# WebSocket message queue - the reader thread only enqueues, a worker drains
+MSG_QUEUE_MAXSIZE = 10000
+MSG_BATCH_MAX = 128
+
+# Byte-level prefilter for the raw frame - checked before any JSON decode
+_ORDERS_MATCHED_B = b'orders_matched'
+_SIZE_RE = re.compile(rb'"size"\s*:\s*"?(\d+)')
+
+# Compiled once - any slug validation should go through this, not per-call
+# string munging
+_SLUG_RE = re.compile(r'^[a-z0-9-]{1,128}$')
+
 # ==============================================================================
 # WHALE TRACKER AGENT
 # ==============================================================================
@@ -88,27 +132,66 @@ class WhaleTrackerAgent:
             cprint("⚠️  All trades will be SIMULATED ONLY", "white", "on_yellow", attrs=['bold'])
             cprint("="*80, "yellow")
         
-        # Create data folder
-        os.makedirs(DATA_FOLDER, exist_ok=True)
-        
-        # Thread-safe lock for CSV access
-        self.csv_lock = threading.Lock()
+        # All persistence goes through this queue to a single writer thread
+        # (classic SPSC handoff - producers never block on file I/O)
+        self._write_queue = queue.Queue()
+
+        # Set to request a clean shutdown (Ctrl+C or SIGTERM)
+        self._stop = threading.Event()
+
+        # Copy-trade evaluations are network-bound (AI swarm + balance) -
+        # run them on a pool so bursts of whale trades overlap their I/O
+        self.executor = ThreadPoolExecutor(max_workers=8, thread_name_prefix="whale-eval")
+
+        # Whale trade queue - on_ws_message enqueues, _consumer_loop drains in batches
+        # so the WebSocket reader thread never blocks on stats lookups or disk I/O
+        self.msg_queue = queue.Queue(maxsize=MSG_QUEUE_MAXSIZE)
+        self.msgs_dropped = 0
         
         # WebSocket connection
         self.ws = None
         self.ws_connected = False
         
-        # Statistics
+        # Statistics - total_trades_tracked is owned by the WS reader thread,
+        # whale_trades_detected by the consumer thread, and the rest are
+        # bumped via the write queue so each counter has exactly one writer
         self.total_trades_tracked = 0
         self.whale_trades_detected = 0
         self.ai_validated_trades = 0
         self.trades_copied = 0
+
+        # Published by the writer thread, read by the status thread as a
+        # single atomic reference - no cross-thread counter reads mid-update
+        self._stats_snapshot = {}
         
-        # Load existing data
-        self.whale_trades_df = self._load_whale_trades()
-        self.whale_wallets_df = self._load_whale_wallets()
-        self.copy_signals_df = self._load_copy_signals()
-        
+        # All datasets, journals and Parquet snapshots live in the store -
+        # only the writer thread touches it after the journal replay below
+        self.store = WhaleStore()
+
+        # O(1) wallet lookup: address -> row position in whale_wallets_df
+        # (the df keeps a clean RangeIndex, so position == label)
+        self._wallet_index = {
+            addr: i for i, addr in enumerate(self.whale_wallets_df['wallet_address'])
+        }
+
+        # Wallet count kept as a plain int so the status thread never has to
+        # probe the DataFrame
+        self._wallet_count = len(self.whale_wallets_df)
+
+        # Column positions for .iat writes - .iat skips label lookup and
+        # boolean masking entirely on the per-trade wallet update
+        self._wallet_cols = {
+            c: self.whale_wallets_df.columns.get_loc(c)
+            for c in ['last_seen', 'trade_count', 'win_rate', 'total_volume', 'profit_loss']
+        }
+
+        # Replay wallet updates a crash left behind since the last snapshot
+        self.store.replay_wallet_journal(self._replay_wallet_entry)
+
+        # Start the writer thread - sole owner of the store from here on
+        writer_thread = threading.Thread(target=self._writer_loop, daemon=True)
+        writer_thread.start()
+
         cprint(f"📊 Loaded {len(self.whale_trades_df)} historical whale trades", "cyan")
         cprint(f"🐋 Tracking {len(self.whale_wallets_df)} known whale wallets", "cyan")
         cprint(f"🎯 Auto-copy: {'✅ ENABLED' if AUTO_COPY_ENABLED else '❌ DISABLED'}", "yellow")
@@ -120,130 +203,199 @@ class WhaleTrackerAgent:
         
         cprint("✨ Initialization complete!\n", "green")
     
-    def _load_whale_trades(self) -> pd.DataFrame:
-        """Load whale trades history from CSV"""
-        if os.path.exists(WHALE_TRADES_CSV):
-            try:
-                df = pd.read_csv(WHALE_TRADES_CSV)
-                return df
-            except Exception as e:
-                cprint(f"⚠️ Error loading whale trades: {e}", "yellow")
-        
-        return pd.DataFrame(columns=[
-            'timestamp', 'market_slug', 'market_title', 'wallet_address',
-            'side', 'price', 'size', 'usd_value', 'trader_win_rate',
-            'ai_validated', 'copied'
-        ])
-    
-    def _load_whale_wallets(self) -> pd.DataFrame:
-        """Load known whale wallets from CSV"""
-        if os.path.exists(WHALE_WALLETS_CSV):
-            try:
-                df = pd.read_csv(WHALE_WALLETS_CSV)
-                return df
-            except Exception as e:
-                cprint(f"⚠️ Error loading whale wallets: {e}", "yellow")
-        
-        return pd.DataFrame(columns=[
-            'wallet_address', 'win_rate', 'total_volume', 'profit_loss',
-            'first_seen', 'last_seen', 'trade_count'
-        ])
-    
-    def _load_copy_signals(self) -> pd.DataFrame:
-        """Load copy trading signals from CSV"""
-        if os.path.exists(COPY_SIGNALS_CSV):
+    @property
+    def whale_trades_df(self) -> pd.DataFrame:
+        """Whale trade history as a DataFrame, materialized on demand"""
+        return self.store.trades_df
+
+    @property
+    def copy_signals_df(self) -> pd.DataFrame:
+        """Copy signal history as a DataFrame, materialized on demand"""
+        return self.store.copy_signals_df
+
+    @property
+    def whale_wallets_df(self) -> pd.DataFrame:
+        """Known whale wallets, held as a real DataFrame in the store"""
+        return self.store.wallets_df
+
+    @whale_wallets_df.setter
+    def whale_wallets_df(self, df: pd.DataFrame):
+        self.store.wallets_df = df
+
+    def _replay_wallet_entry(self, entry: dict):
+        """Apply one journaled wallet update during startup replay"""
+        self._update_whale_wallet(
+            entry.get('addr', ''), entry.get('stats') or {},
+            entry.get('ts'), journal=False)
+
+    def _writer_loop(self):
+        """Single writer thread - drains the write queue and owns all file state
+
+        Producers (the WS consumer and the eval pool) only enqueue tagged
+        rows, so the buffers, the wallet DataFrame and the Parquet writers
+        are never touched from more than one thread.
+        """
+        while True:
+            tag, item = self._write_queue.get()
+
+            # task_done() always fires, even when a journal write raises -
+            # otherwise one poisoned item would leave unfinished_tasks
+            # inflated and the join() in run()'s shutdown would hang forever
             try:
-                df = pd.read_csv(COPY_SIGNALS_CSV)
-                return df
+                if tag == 'whale_trade':
+                    self.store.add_trade(item)
+                elif tag == 'wallet_update':
+                    self._update_whale_wallet(*item)
+                elif tag == 'copy_signal':
+                    self.store.add_copy_signal(item)
+                elif tag == 'stat':
+                    setattr(self, item, getattr(self, item) + 1)
+                elif tag == 'flush':
+                    self.store.flush_all()
+
+                self.store.maybe_flush()
+                self._publish_stats()
             except Exception as e:
-                cprint(f"⚠️ Error loading copy signals: {e}", "yellow")
-        
-        return pd.DataFrame(columns=[
-            'timestamp', 'market_slug', 'market_title', 'whale_wallet',
-            'whale_side', 'whale_size', 'our_side', 'our_size',
-            'ai_consensus', 'executed', 'outcome'
-        ])
-    
-    def _save_whale_trades(self):
-        """Save whale trades to CSV"""
-        try:
-            with self.csv_lock:
-                self.whale_trades_df.to_csv(WHALE_TRADES_CSV, index=False)
-        except Exception as e:
-            cprint(f"❌ Error saving whale trades: {e}", "red")
-    
-    def _save_whale_wallets(self):
-        """Save whale wallets to CSV"""
-        try:
-            with self.csv_lock:
-                self.whale_wallets_df.to_csv(WHALE_WALLETS_CSV, index=False)
-        except Exception as e:
-            cprint(f"❌ Error saving whale wallets: {e}", "red")
-    
-    def _save_copy_signals(self):
-        """Save copy signals to CSV"""
-        try:
-            with self.csv_lock:
-                self.copy_signals_df.to_csv(COPY_SIGNALS_CSV, index=False)
-        except Exception as e:
-            cprint(f"❌ Error saving copy signals: {e}", "red")
-    
+                cprint(f"❌ Error in writer loop ({tag}): {e}", "red")
+            finally:
+                self._write_queue.task_done()
+
+    def _publish_stats(self):
+        """Publish a stats snapshot for the status thread (one atomic ref swap)"""
+        self._stats_snapshot = {
+            'whale_trades_detected': self.whale_trades_detected,
+            'ai_validated_trades': self.ai_validated_trades,
+            'trades_copied': self.trades_copied,
+            'wallet_count': self._wallet_count,
+        }
+
     def on_ws_message(self, ws, message):
         """Handle incoming WebSocket messages"""
+        # Cheap byte-level prefilter: most frames are sub-whale trades that
+        # don't deserve a full JSON decode. Shares cap at $1 each, so a trade
+        # worth MIN_WHALE_TRADE_SIZE needs at least that many shares.
+        message_b = message.encode() if isinstance(message, str) else message
+
+        if _ORDERS_MATCHED_B in message_b:
+            self.total_trades_tracked += 1
+            if not self.ws_connected:
+                self.ws_connected = True
+
+            size_match = _SIZE_RE.search(message_b)
+            if size_match and int(size_match.group(1)) < MIN_WHALE_TRADE_SIZE:
+                return
+
         try:
-            data = json.loads(message)
-            
+            # Fast path: single-pass typed decode straight off the bytes
+            if _ws_decoder is not None:
+                try:
+                    env = _ws_decoder.decode(message_b)
+                except _ws_decode_error:
+                    env = None  # Unrecognized shape - fall back to the dict path
+
+                if env is not None:
+                    if env.type == 'subscribed':
+                        cprint("✅ WebSocket subscribed to live trades!", "green")
+                        self.ws_connected = True
+                    elif env.type == 'pong':
+                        pass
+                    elif env.topic == 'activity' and env.type == 'orders_matched' and env.payload is not None:
+                        usd_value = env.payload.price * env.payload.size
+                        if usd_value >= MIN_WHALE_TRADE_SIZE:
+                            self._enqueue_whale_trade(env.payload, usd_value)
+                    return
+
+            data = _loads(message)
+
             if isinstance(data, dict):
                 # Handle subscription confirmation
                 if data.get('type') == 'subscribed':
                     cprint("✅ WebSocket subscribed to live trades!", "green")
                     self.ws_connected = True
                     return
-                
+
                 # Handle pong
                 if data.get('type') == 'pong':
                     return
-                
+
                 # Handle trade data
                 topic = data.get('topic')
                 msg_type = data.get('type')
                 payload = data.get('payload', {})
-                
+
                 if topic == 'activity' and msg_type == 'orders_matched':
-                    self.total_trades_tracked += 1
-                    
-                    if not self.ws_connected:
-                        self.ws_connected = True
-                    
                     # Extract trade info
                     price = float(payload.get('price', 0))
                     size = float(payload.get('size', 0))
                     usd_value = price * size
-                    
-                    # Check if this is a whale trade
+
+                    # Check if this is a whale trade - hand off to the consumer
+                    # thread so the reader returns to the socket immediately
                     if usd_value >= MIN_WHALE_TRADE_SIZE:
-                        self.process_whale_trade(payload, usd_value)
-        
-        except json.JSONDecodeError:
+                        self._enqueue_whale_trade(payload, usd_value)
+
+        except ValueError:
+            # Covers both json.JSONDecodeError and orjson.JSONDecodeError
             pass
         except Exception as e:
             cprint(f"⚠️ Error processing WebSocket message: {e}", "yellow")
+
+    def _enqueue_whale_trade(self, payload, usd_value: float):
+        """Hand a whale trade to the consumer thread without blocking the reader"""
+        try:
+            self.msg_queue.put_nowait((payload, usd_value))
+        except queue.Full:
+            self.msgs_dropped += 1
+            cprint(f"⚠️ Whale queue full - dropped trade ({self.msgs_dropped} total)", "yellow")
     
+    def _consumer_loop(self):
+        """Drain whale trades off the queue in batches
+
+        Blocks on the first message, then drains whatever else is queued
+        (capped at MSG_BATCH_MAX) so bursts get processed as one batch.
+        """
+        while True:
+            try:
+                batch = [self.msg_queue.get()]
+                while len(batch) < MSG_BATCH_MAX:
+                    try:
+                        batch.append(self.msg_queue.get_nowait())
+                    except queue.Empty:
+                        break
+
+                for payload, usd_value in batch:
+                    self.process_whale_trade(payload, usd_value)
+
+            except Exception as e:
+                cprint(f"❌ Error in whale consumer loop: {e}", "red")
+
     def process_whale_trade(self, trade_data: dict, usd_value: float):
         """Process a detected whale trade"""
         self.whale_trades_detected += 1
-        
-        # Extract trade details
-        market_slug = trade_data.get('eventSlug', '')
-        market_title = trade_data.get('title', 'Unknown')
-        wallet = trade_data.get('trader', 'Unknown')
-        side = trade_data.get('side', '')
-        price = float(trade_data.get('price', 0))
-        size = float(trade_data.get('size', 0))
+
+        # One timestamp per trade - reused for the trade row, the wallet
+        # update and the copy signal instead of 5 separate clock reads
+        now_iso = datetime.now().isoformat()
+        
+        # Extract trade details (typed struct from msgspec, dict otherwise)
+        if isinstance(trade_data, dict):
+            market_slug = trade_data.get('eventSlug', '')
+            market_title = trade_data.get('title', 'Unknown')
+            wallet = trade_data.get('trader', 'Unknown')
+            side = trade_data.get('side', '')
+            price = float(trade_data.get('price', 0))
+            size = float(trade_data.get('size', 0))
+        else:
+            market_slug = trade_data.eventSlug
+            market_title = trade_data.title
+            wallet = trade_data.trader
+            side = trade_data.side
+            price = trade_data.price
+            size = trade_data.size
         
         cprint(f"\n🐋 WHALE TRADE DETECTED!", "white", "on_cyan")
-        cprint(f"   Market: {market_title[:60]}...", "cyan")
-        cprint(f"   Wallet: {wallet[:16]}...", "cyan")
+        cprint(f"   Market: {market_title:.60}...", "cyan")
+        cprint(f"   Wallet: {wallet:.16}...", "cyan")
         cprint(f"   Side: {side}", "cyan")
         cprint(f"   Size: {format_usd(usd_value)}", "yellow", attrs=['bold'])
         
@@ -261,7 +413,7 @@ class WhaleTrackerAgent:
         
         # Save whale trade
         new_trade = {
-            'timestamp': datetime.now().isoformat(),
+            'timestamp': now_iso,
             'market_slug': market_slug,
             'market_title': market_title,
             'wallet_address': wallet,
@@ -274,32 +426,37 @@ class WhaleTrackerAgent:
             'copied': False
         }
         
-        self.whale_trades_df = pd.concat([
-            self.whale_trades_df,
-            pd.DataFrame([new_trade])
-        ], ignore_index=True)
-        
-        self._save_whale_trades()
-        
-        # Update whale wallet tracking
-        self._update_whale_wallet(wallet, trader_stats)
-        
-        # Check if we should copy this trade
+        self._write_queue.put(('whale_trade', new_trade))
+
+        # Update whale wallet tracking (handled by the writer thread)
+        self._write_queue.put(('wallet_update', (wallet, trader_stats, now_iso)))
+
+        # Check if we should copy this trade - evaluations run on the pool
+        # so one slow AI round-trip doesn't stall the consumer
         if is_quality_whale and AUTO_COPY_ENABLED:
-            self._evaluate_copy_trade(market_slug, market_title, side, usd_value, wallet, win_rate)
+            self.executor.submit(
+                self._evaluate_copy_trade,
+                market_slug, market_title, side, usd_value, wallet, win_rate, now_iso
+            )
     
-    def _update_whale_wallet(self, wallet: str, stats: dict):
+    def _update_whale_wallet(self, wallet: str, stats: dict, now_iso: str = None, journal: bool = True):
         """Update whale wallet statistics"""
-        if wallet in self.whale_wallets_df['wallet_address'].values:
-            # Update existing wallet
-            mask = self.whale_wallets_df['wallet_address'] == wallet
-            self.whale_wallets_df.loc[mask, 'last_seen'] = datetime.now().isoformat()
-            self.whale_wallets_df.loc[mask, 'trade_count'] = self.whale_wallets_df.loc[mask, 'trade_count'] + 1
-            
+        if now_iso is None:
+            now_iso = datetime.now().isoformat()
+
+        idx = self._wallet_index.get(wallet)
+        if idx is not None:
+            # Update existing wallet by row/column position - no linear scan,
+            # no label lookup, no mask allocation
+            df = self.whale_wallets_df
+            wc = self._wallet_cols
+            df.iat[idx, wc['last_seen']] = now_iso
+            df.iat[idx, wc['trade_count']] = df.iat[idx, wc['trade_count']] + 1
+
             if stats:
-                self.whale_wallets_df.loc[mask, 'win_rate'] = stats.get('win_rate', 0)
-                self.whale_wallets_df.loc[mask, 'total_volume'] = stats.get('total_volume', 0)
-                self.whale_wallets_df.loc[mask, 'profit_loss'] = stats.get('profit_loss', 0)
+                df.iat[idx, wc['win_rate']] = stats.get('win_rate', 0)
+                df.iat[idx, wc['total_volume']] = stats.get('total_volume', 0)
+                df.iat[idx, wc['profit_loss']] = stats.get('profit_loss', 0)
         else:
             # Add new whale
             new_whale = {
@@ -307,8 +464,8 @@ class WhaleTrackerAgent:
                 'win_rate': stats.get('win_rate', 0) if stats else 0,
                 'total_volume': stats.get('total_volume', 0) if stats else 0,
                 'profit_loss': stats.get('profit_loss', 0) if stats else 0,
-                'first_seen': datetime.now().isoformat(),
-                'last_seen': datetime.now().isoformat(),
+                'first_seen': now_iso,
+                'last_seen': now_iso,
                 'trade_count': 1
             }
             
@@ -316,8 +473,13 @@ class WhaleTrackerAgent:
                 self.whale_wallets_df,
                 pd.DataFrame([new_whale])
             ], ignore_index=True)
-        
-        self._save_whale_wallets()
+            self._wallet_index[wallet] = len(self.whale_wallets_df) - 1
+            self._wallet_count += 1
+
+        self.store.wallets_dirty = True
+
+        if journal:
+            self.store.journal_wallet({'addr': wallet, 'stats': stats or {}, 'ts': now_iso})
     
     def _evaluate_copy_trade(
         self,
@@ -326,7 +488,8 @@ class WhaleTrackerAgent:
         whale_side: str,
         whale_size_usd: float,
         whale_wallet: str,
-        whale_win_rate: float
+        whale_win_rate: float,
+        now_iso: str
     ):
         """Evaluate if we should copy this whale trade"""
         cprint(f"\n🤖 Evaluating copy trade opportunity...", "white", "on_magenta")
@@ -338,7 +501,7 @@ class WhaleTrackerAgent:
             cprint(f"❌ AI rejected this trade - not copying", "red")
             return
         
-        self.ai_validated_trades += 1
+        self._write_queue.put(('stat', 'ai_validated_trades'))
         
         # Step 2: Calculate our position size
         copy_size_usd = min(
@@ -374,14 +537,14 @@ class WhaleTrackerAgent:
                 side="BUY",  # We're copying the whale, so always BUY
                 market_slug=market_slug,
                 market_title=market_title,
-                notes=f"Whale copy: {whale_wallet[:16]}... | Win rate: {whale_win_rate:.1f}% | AI validated"
+                notes=f"Whale copy: {whale_wallet:.16}... | Win rate: {whale_win_rate:.1f}% | AI validated"
             )
             
             executed = order_id is not None
             
             # Save copy signal
             copy_signal = {
-                'timestamp': datetime.now().isoformat(),
+                'timestamp': now_iso,
                 'market_slug': market_slug,
                 'market_title': market_title,
                 'whale_wallet': whale_wallet,
@@ -394,15 +557,10 @@ class WhaleTrackerAgent:
                 'outcome': 'PENDING'
             }
             
-            self.copy_signals_df = pd.concat([
-                self.copy_signals_df,
-                pd.DataFrame([copy_signal])
-            ], ignore_index=True)
-            
-            self._save_copy_signals()
+            self._write_queue.put(('copy_signal', copy_signal))
             
             if executed:
-                self.trades_copied += 1
+                self._write_queue.put(('stat', 'trades_copied'))
                 if PAPER_TRADING_ENABLED:
                     cprint(f"✅ Paper trade simulated! (Trade ID: {order_id})", "white", "on_green")
                 else:
@@ -438,22 +596,10 @@ class WhaleTrackerAgent:
         }
         
         cprint(f"📡 Sending subscription for live trades...", "cyan")
-        ws.send(json.dumps(subscription_msg))
+        ws.send(_dumps(subscription_msg))
         
         self.ws_connected = True
         cprint("✅ Subscription sent! Waiting for whale trades...", "green")
-        
-        # Start ping thread
-        def send_ping():
-            while True:
-                time.sleep(5)
-                try:
-                    ws.send(json.dumps({"type": "ping"}))
-                except:
-                    break
-        
-        ping_thread = threading.Thread(target=send_ping, daemon=True)
-        ping_thread.start()
     
     def connect_websocket(self):
         """Connect to Polymarket WebSocket"""
@@ -467,10 +613,33 @@ class WhaleTrackerAgent:
             on_close=self.on_ws_close
         )
         
-        # Run WebSocket in a thread
-        ws_thread = threading.Thread(target=self.ws.run_forever, daemon=True)
+        # Run WebSocket in a thread - the library's built-in pinger replaces
+        # the old hand-rolled 5s ping thread and handles pong timeouts too.
+        # TCP_NODELAY kills Nagle's up-to-40ms frame delay, a 4MB receive
+        # buffer lets the kernel absorb trade bursts, and UTF-8 validation
+        # is skipped since orjson validates during decode anyway.
+        ws_thread = threading.Thread(
+            target=self.ws.run_forever,
+            kwargs={
+                "ping_interval": 5,
+                "ping_timeout": 3,
+                "ping_payload": '{"type":"ping"}',
+                "sockopt": (
+                    (socket.IPPROTO_TCP, socket.TCP_NODELAY, 1),
+                    (socket.SOL_SOCKET, socket.SO_RCVBUF, 4 * 1024 * 1024),
+                ),
+                "skip_utf8_validation": True
+            },
+            daemon=True
+        )
         ws_thread.start()
-        
+
+        # Start the whale trade consumer thread (once - reconnects reuse it)
+        if not getattr(self, '_consumer_started', False):
+            consumer_thread = threading.Thread(target=self._consumer_loop, daemon=True)
+            consumer_thread.start()
+            self._consumer_started = True
+
         cprint("✅ WebSocket thread started!", "green")
     
     def status_display_loop(self):
@@ -482,14 +651,19 @@ class WhaleTrackerAgent:
                 time.sleep(30)
                 
                 cprint(f"\n{'='*60}", "cyan")
-                cprint(f"🐋 Whale Tracker Status @ {datetime.now().strftime('%H:%M:%S')}", "cyan", attrs=['bold'])
+                cprint(f"🐋 Whale Tracker Status @ {time.strftime('%H:%M:%S')}", "cyan", attrs=['bold'])
                 cprint(f"{'='*60}", "cyan")
+                # Snapshot is swapped in whole by the writer thread; the two
+                # live reads below each have a single writer, so nothing here
+                # can observe a counter mid-update
+                snap = self._stats_snapshot
+
                 cprint(f"   WebSocket: {'✅ Connected' if self.ws_connected else '❌ Disconnected'}", "green" if self.ws_connected else "red")
                 cprint(f"   Total Trades Tracked: {self.total_trades_tracked:,}", "white")
-                cprint(f"   Whale Trades Detected: {self.whale_trades_detected:,}", "yellow")
-                cprint(f"   AI Validated Trades: {self.ai_validated_trades:,}", "green")
-                cprint(f"   Trades Copied: {self.trades_copied:,}", "cyan", attrs=['bold'])
-                cprint(f"   Known Whale Wallets: {len(self.whale_wallets_df)}", "white")
+                cprint(f"   Whale Trades Detected: {snap.get('whale_trades_detected', 0):,}", "yellow")
+                cprint(f"   AI Validated Trades: {snap.get('ai_validated_trades', 0):,}", "green")
+                cprint(f"   Trades Copied: {snap.get('trades_copied', 0):,}", "cyan", attrs=['bold'])
+                cprint(f"   Known Whale Wallets: {snap.get('wallet_count', self._wallet_count)}", "white")
                 cprint(f"{'='*60}\n", "cyan")
                 
             except KeyboardInterrupt:
@@ -512,16 +686,31 @@ class WhaleTrackerAgent:
         cprint("🔍 Tracking whale trades in real-time...", "cyan")
         cprint("⏸️  Press Ctrl+C to stop\n", "yellow")
         
+        # Park the main thread in the kernel until shutdown is requested -
+        # no once-a-second wakeups, and `kill` gets the same clean flush
+        signal.signal(signal.SIGTERM, lambda *_: self._stop.set())
+
         try:
-            while True:
-                time.sleep(1)
+            self._stop.wait()
         except KeyboardInterrupt:
-            cprint("\n\n🛑 Stopping Whale Tracker...", "yellow")
-            cprint("💾 Saving final data...", "cyan")
-            self._save_whale_trades()
-            self._save_whale_wallets()
-            self._save_copy_signals()
-            cprint("✅ Shutdown complete!\n", "green")
+            self._stop.set()
+
+        cprint("\n\n🛑 Stopping Whale Tracker...", "yellow")
+        cprint("💾 Saving final data...", "cyan")
+        self.executor.shutdown(wait=True, cancel_futures=True)
+        self._write_queue.put(('flush', None))
+        self._write_queue.join()
+        self.store.close()
+
+        # Copied paper trades live in the paper engine's own writer thread -
+        # drain it too so simulated fills survive the shutdown
+        if PAPER_TRADING_ENABLED:
+            from src.nice_funcs_polymarket import _get_paper_engine
+            engine = _get_paper_engine()
+            if engine:
+                engine.close()
+
+        cprint("✅ Shutdown complete!\n", "green")
 
 
 # ==============================================================================
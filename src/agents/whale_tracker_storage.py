@@ -0,0 +1,383 @@
+"""
+🌙 Moon Dev's Whale Tracker Storage Layer
+Built with love by Moon Dev 🚀
+
+On-disk state for the whale tracker, split out so the agent stays focused
+on the WebSocket/AI flow. Layout is journal + snapshot:
+
+- every row appends to a jsonl journal on the fast flush cadence, so a
+  crash can only lose rows still sitting in the write buffer
+- a full Parquet snapshot is written on a slow cadence to a temp file and
+  os.replace'd into place, so the store is readable at every instant
+- journals are truncated once a snapshot covers them and replayed on
+  startup after a crash
+
+Only the agent's writer thread may touch a WhaleStore - nothing in here
+takes a lock.
+"""
+
+import os
+import sys
+import json
+import time
+import pandas as pd
+import pyarrow as pa
+import pyarrow.parquet as pq
+from pathlib import Path
+from termcolor import cprint
+
+# orjson serializes the journal rows (and decodes WebSocket frames for the
+# agent) ~3-5x faster than stdlib json - fall back to stdlib if missing
+try:
+    import orjson
+    _loads = orjson.loads
+
+    def _dumps(obj) -> str:
+        return orjson.dumps(obj).decode()
+except ImportError:
+    _loads = json.loads
+    _dumps = json.dumps
+
+# Add project root to path
+project_root = str(Path(__file__).parent.parent.parent)
+if project_root not in sys.path:
+    sys.path.insert(0, project_root)
+
+# ==============================================================================
+# PATHS & SCHEMAS
+# ==============================================================================
+
+# Data Paths - Parquet is the primary store (typed, compressed, fast loads);
+# the CSV paths remain for legacy migration and export_csv()
+DATA_FOLDER = Path(project_root) / "src/data/polymarket_whales"
+WHALE_TRADES_PARQUET = DATA_FOLDER / "whale_trades.parquet"
+WHALE_WALLETS_PARQUET = DATA_FOLDER / "whale_wallets.parquet"
+COPY_SIGNALS_PARQUET = DATA_FOLDER / "copy_signals.parquet"
+WHALE_TRADES_CSV = DATA_FOLDER / "whale_trades.csv"
+WHALE_WALLETS_CSV = DATA_FOLDER / "whale_wallets.csv"
+COPY_SIGNALS_CSV = DATA_FOLDER / "copy_signals.csv"
+
+# Append-only jsonl journals - every row lands here between snapshots, so
+# a crash at any point can only be missing rows still in the write buffer
+WHALE_TRADES_JOURNAL = DATA_FOLDER / "whale_trades.jsonl"
+WHALE_WALLETS_JOURNAL = DATA_FOLDER / "wallets.jsonl"
+COPY_SIGNALS_JOURNAL = DATA_FOLDER / "copy_signals.jsonl"
+
+# CSV Schemas (shared by the loaders and the journal/snapshot writers)
+WHALE_TRADE_COLUMNS = [
+    'timestamp', 'market_slug', 'market_title', 'wallet_address',
+    'side', 'price', 'size', 'usd_value', 'trader_win_rate',
+    'ai_validated', 'copied'
+]
+WHALE_WALLET_COLUMNS = [
+    'wallet_address', 'win_rate', 'total_volume', 'profit_loss',
+    'first_seen', 'last_seen', 'trade_count'
+]
+COPY_SIGNAL_COLUMNS = [
+    'timestamp', 'market_slug', 'market_title', 'whale_wallet',
+    'whale_side', 'whale_size', 'our_side', 'our_size',
+    'ai_consensus', 'executed', 'outcome'
+]
+
+# Explicit Arrow schemas so writes never pay type inference
+WHALE_TRADE_SCHEMA = pa.schema([
+    ('timestamp', pa.string()),
+    ('market_slug', pa.string()),
+    ('market_title', pa.string()),
+    ('wallet_address', pa.string()),
+    ('side', pa.string()),
+    ('price', pa.float64()),
+    ('size', pa.float64()),
+    ('usd_value', pa.float64()),
+    ('trader_win_rate', pa.float64()),
+    ('ai_validated', pa.bool_()),
+    ('copied', pa.bool_())
+])
+COPY_SIGNAL_SCHEMA = pa.schema([
+    ('timestamp', pa.string()),
+    ('market_slug', pa.string()),
+    ('market_title', pa.string()),
+    ('whale_wallet', pa.string()),
+    ('whale_side', pa.string()),
+    ('whale_size', pa.float64()),
+    ('our_side', pa.string()),
+    ('our_size', pa.float64()),
+    ('ai_consensus', pa.float64()),
+    ('executed', pa.bool_()),
+    ('outcome', pa.string())
+])
+
+# Flush buffered rows to the journals every K rows or T seconds
+FLUSH_MAX_ROWS = 50
+FLUSH_INTERVAL_SECONDS = 10
+
+# Full Parquet snapshots happen on this cadence. Each one is swapped in
+# atomically, so the journals only cover the gap since the last swap
+SNAPSHOT_INTERVAL_SECONDS = 60
+
+# ==============================================================================
+# HELPERS
+# ==============================================================================
+
+def load_table(parquet_path: Path, csv_path: Path, columns: list) -> pd.DataFrame:
+    """Load a dataset - Parquet first, legacy CSV as a one-time fallback"""
+    if parquet_path.is_file():
+        try:
+            return pq.read_table(parquet_path).to_pandas()
+        except Exception as e:
+            cprint(f"⚠️ Error loading {parquet_path.name}: {e}", "yellow")
+
+    if csv_path.is_file():
+        try:
+            return pd.read_csv(csv_path)
+        except Exception as e:
+            cprint(f"⚠️ Error loading {csv_path.name}: {e}", "yellow")
+
+    return pd.DataFrame(columns=columns)
+
+
+def snapshot_parquet(path: Path, table: pa.Table):
+    """Atomically replace a Parquet snapshot (write temp, then os.replace)
+
+    A whole-file swap means the store on disk is complete and readable
+    at every instant - an OOM/SIGKILL mid-write leaves only a stale
+    .tmp behind, never a footerless Parquet file.
+    """
+    tmp = str(path) + '.tmp'
+    pq.write_table(table, tmp)
+    os.replace(tmp, path)
+
+
+def replay_journal(path: Path, sink) -> int:
+    """Replay journaled rows a crash left behind since the last snapshot"""
+    if not path.is_file():
+        return 0
+
+    replayed = 0
+    try:
+        with open(path) as f:
+            for line in f:
+                line = line.strip()
+                if not line:
+                    continue
+                sink(json.loads(line))
+                replayed += 1
+    except Exception as e:
+        cprint(f"⚠️ Error replaying {path.name}: {e}", "yellow")
+
+    if replayed:
+        cprint(f"🔁 Replayed {replayed} journaled rows from {path.name}", "cyan")
+    return replayed
+
+
+def _truncate_journal(handle, path: Path):
+    """Reset a journal once its rows are covered by a snapshot"""
+    handle.close()
+    return open(path, 'w')
+
+
+def _append_journal(handle, rows: list):
+    """Append buffered rows to a jsonl journal in one write"""
+    handle.write(''.join(_dumps(r) + '\n' for r in rows))
+    handle.flush()
+
+# ==============================================================================
+# WHALE STORE
+# ==============================================================================
+
+class WhaleStore:
+    """Owns the whale tracker's datasets, journals and Parquet snapshots
+
+    Whale trades are kept as parallel column lists (SoA) - appending a
+    trade is a handful of pointer writes instead of a pandas insert, and
+    trades_df materializes on demand.
+    """
+
+    def __init__(self):
+        # Create data folder (skip the mkdir syscall when it's already there)
+        if not DATA_FOLDER.is_dir():
+            DATA_FOLDER.mkdir(parents=True, exist_ok=True)
+
+        loaded_trades = load_table(WHALE_TRADES_PARQUET, WHALE_TRADES_CSV, WHALE_TRADE_COLUMNS)
+        self.trades_cols = {c: loaded_trades[c].tolist() for c in WHALE_TRADE_COLUMNS}
+        self.wallets_df = load_table(WHALE_WALLETS_PARQUET, WHALE_WALLETS_CSV, WHALE_WALLET_COLUMNS)
+        self.copy_rows = load_table(COPY_SIGNALS_PARQUET, COPY_SIGNALS_CSV, COPY_SIGNAL_COLUMNS).to_dict('records')
+
+        # Write buffers - rows accumulate here and flush to the journals
+        # every FLUSH_MAX_ROWS rows or FLUSH_INTERVAL_SECONDS seconds
+        self.trade_buffer = []
+        self.copy_buffer = []
+        self.trades_dirty = False
+        self.copy_dirty = False
+        self.wallets_dirty = False
+        self._last_flush_ts = time.time()
+        self._last_snapshot_ts = time.time()
+
+        # Replayed rows stay dirty so the next snapshot folds them in
+        if replay_journal(WHALE_TRADES_JOURNAL, self.append_trade_row):
+            self.trades_dirty = True
+        if replay_journal(COPY_SIGNALS_JOURNAL, self.copy_rows.append):
+            self.copy_dirty = True
+
+        self._trades_journal = open(WHALE_TRADES_JOURNAL, 'a')
+        self._copy_journal = open(COPY_SIGNALS_JOURNAL, 'a')
+        self._wallet_journal = None  # opened by replay_wallet_journal
+
+    @property
+    def trades_df(self) -> pd.DataFrame:
+        """Whale trade history as a DataFrame, materialized on demand"""
+        return pd.DataFrame(self.trades_cols, copy=False)
+
+    @property
+    def copy_signals_df(self) -> pd.DataFrame:
+        """Copy signal history as a DataFrame, materialized on demand"""
+        return pd.DataFrame(self.copy_rows, columns=COPY_SIGNAL_COLUMNS)
+
+    def append_trade_row(self, row: dict):
+        """Fold one trade row into the in-memory column store"""
+        for k, v in row.items():
+            self.trades_cols[k].append(v)
+
+    def add_trade(self, row: dict):
+        """Buffer a new whale trade for the next journal flush"""
+        self.trade_buffer.append(row)
+        self.append_trade_row(row)
+        self.trades_dirty = True
+
+    def add_copy_signal(self, row: dict):
+        """Buffer a new copy signal for the next journal flush"""
+        self.copy_buffer.append(row)
+        self.copy_rows.append(row)
+        self.copy_dirty = True
+
+    def replay_wallet_journal(self, sink):
+        """Replay journaled wallet updates into sink, then open the journal
+
+        The caller owns the wallet update logic (stats merging, index
+        maintenance), so replay hands each entry dict to its sink.
+        """
+        replay_journal(WHALE_WALLETS_JOURNAL, sink)
+        self._wallet_journal = open(WHALE_WALLETS_JOURNAL, 'a')
+
+    def journal_wallet(self, entry: dict):
+        """Append one wallet update to the journal (crash recovery)"""
+        self._wallet_journal.write(_dumps(entry) + '\n')
+        self._wallet_journal.flush()
+
+    def _flush_whale_trades(self):
+        """Journal buffered whale trades (already in the column store)"""
+        if not self.trade_buffer:
+            return
+        try:
+            _append_journal(self._trades_journal, self.trade_buffer)
+            self.trade_buffer = []
+        except Exception as e:
+            cprint(f"❌ Error saving whale trades: {e}", "red")
+
+    def _flush_copy_signals(self):
+        """Journal buffered copy signals (already in the row store)"""
+        if not self.copy_buffer:
+            return
+        try:
+            _append_journal(self._copy_journal, self.copy_buffer)
+            self.copy_buffer = []
+        except Exception as e:
+            cprint(f"❌ Error saving copy signals: {e}", "red")
+
+    def _flush_whale_wallets(self):
+        """Rewrite the whale wallets snapshot, but only when something changed"""
+        if not self.wallets_dirty:
+            return
+        try:
+            snapshot_parquet(
+                WHALE_WALLETS_PARQUET,
+                pa.Table.from_pandas(self.wallets_df, preserve_index=False))
+            self.wallets_dirty = False
+
+            # The snapshot now covers everything - reset the journal
+            self._wallet_journal = _truncate_journal(self._wallet_journal, WHALE_WALLETS_JOURNAL)
+        except Exception as e:
+            cprint(f"❌ Error saving whale wallets: {e}", "red")
+
+    def _snapshot_all(self):
+        """Write fresh Parquet snapshots for every dirty dataset"""
+        if self.trades_dirty:
+            try:
+                snapshot_parquet(
+                    WHALE_TRADES_PARQUET,
+                    pa.Table.from_pydict(self.trades_cols, schema=WHALE_TRADE_SCHEMA))
+                self._trades_journal = _truncate_journal(self._trades_journal, WHALE_TRADES_JOURNAL)
+                self.trades_dirty = False
+            except Exception as e:
+                cprint(f"❌ Error snapshotting whale trades: {e}", "red")
+
+        if self.copy_dirty:
+            try:
+                snapshot_parquet(
+                    COPY_SIGNALS_PARQUET,
+                    pa.Table.from_pylist(self.copy_rows, schema=COPY_SIGNAL_SCHEMA))
+                self._copy_journal = _truncate_journal(self._copy_journal, COPY_SIGNALS_JOURNAL)
+                self.copy_dirty = False
+            except Exception as e:
+                cprint(f"❌ Error snapshotting copy signals: {e}", "red")
+
+        self._flush_whale_wallets()
+
+    def flush_all(self):
+        """Flush every buffer and write fresh snapshots"""
+        self._flush_whale_trades()
+        self._flush_copy_signals()
+        self._snapshot_all()
+        self._last_flush_ts = time.time()
+        self._last_snapshot_ts = time.time()
+
+    def maybe_flush(self):
+        """Journal rows on the fast cadence, snapshot Parquet on the slow one
+
+        Every journaled row survives a crash, so the snapshots only have to
+        bound replay time - and each one is swapped in atomically.
+        """
+        buffered = len(self.trade_buffer) + len(self.copy_buffer)
+        if buffered >= FLUSH_MAX_ROWS or (time.time() - self._last_flush_ts) >= FLUSH_INTERVAL_SECONDS:
+            self._flush_whale_trades()
+            self._flush_copy_signals()
+            self._last_flush_ts = time.time()
+
+        if (time.time() - self._last_snapshot_ts) >= SNAPSHOT_INTERVAL_SECONDS:
+            self._snapshot_all()
+            self._last_snapshot_ts = time.time()
+
+    def close(self):
+        """Close the journal handles and push the final snapshots to disk"""
+        for handle in (self._trades_journal, self._copy_journal, self._wallet_journal):
+            if handle is not None:
+                handle.close()
+
+        for path in (WHALE_TRADES_PARQUET, COPY_SIGNALS_PARQUET, WHALE_WALLETS_PARQUET):
+            if path.is_file():
+                fd = os.open(path, os.O_RDONLY)
+                os.fsync(fd)
+                os.close(fd)
+
+# ==============================================================================
+# CSV EXPORT
+# ==============================================================================
+
+def export_csv():
+    """One-shot export of the Parquet datasets back to CSV for spreadsheet use
+
+    Snapshots are swapped in atomically, so this works at any time; rows
+    newer than the last snapshot (up to a minute) live in the jsonl
+    journals until the next swap.
+    """
+    pairs = [
+        (WHALE_TRADES_PARQUET, WHALE_TRADES_CSV),
+        (WHALE_WALLETS_PARQUET, WHALE_WALLETS_CSV),
+        (COPY_SIGNALS_PARQUET, COPY_SIGNALS_CSV),
+    ]
+    for parquet_path, csv_path in pairs:
+        if parquet_path.is_file():
+            pq.read_table(parquet_path).to_pandas().to_csv(csv_path, index=False)
+            cprint(f"✅ Exported {csv_path.name}", "green")
+        else:
+            cprint(f"⚠️ No data for {parquet_path.name}", "yellow")
@@ -15,12 +15,22 @@ Setup:
 """
 
 import os
+import re
 import sys
 import time
 import json
+import socket
+import asyncio
+import threading
 import requests
+from concurrent.futures import ThreadPoolExecutor
+from cachetools import TTLCache
+from urllib3.util.retry import Retry
 import pandas as pd
+import numpy as np
 from datetime import datetime, timedelta
+from dataclasses import dataclass, asdict
+from contextlib import contextmanager
 from termcolor import colored, cprint
 from dotenv import load_dotenv
 from typing import Optional, Dict, List, Tuple
@@ -28,6 +38,39 @@ from typing import Optional, Dict, List, Tuple
 # Load environment variables
 load_dotenv()
 
+# Silence informational prints on hot paths (batch scans, bulk cancels) -
+# ANSI formatting and blocking stdout writes add up when called per market
+_QUIET = os.getenv("POLYMARKET_QUIET", "0") == "1"
+
+
+def _pretty(*args, **kwargs):
+    """cprint gated behind the quiet flag - use for per-call chatter"""
+    if not _QUIET:
+        cprint(*args, **kwargs)
+
+
+@contextmanager
+def quiet_mode():
+    """Temporarily silence per-call prints (for batch scanning loops)"""
+    global _QUIET
+    prev = _QUIET
+    _QUIET = True
+    try:
+        yield
+    finally:
+        _QUIET = prev
+
+# orjson decodes the dense JSON arrays Gamma/Data return 2-5x faster than
+# stdlib json - fall back to requests' own parser if it isn't installed
+try:
+    import orjson
+
+    def _parse_response(response):
+        return orjson.loads(response.content)
+except ImportError:
+    def _parse_response(response):
+        return response.json()
+
 # ==============================================================================
 # POLYMARKET CLIENT SETUP
 # ==============================================================================
@@ -68,6 +111,98 @@ GAMMA_API = "https://gamma-api.polymarket.com"
 DATA_API = "https://data-api.polymarket.com"
 CHAIN_ID = 137  # Polygon network
 
+# Shared HTTP session - a keep-alive connection pool means REST calls skip
+# the fresh TCP + TLS handshake (~100ms against Polymarket's edge) per call
+
+class _LowLatencyAdapter(requests.adapters.HTTPAdapter):
+    """HTTPAdapter with TCP_NODELAY so small API requests aren't Nagle-delayed"""
+
+    def init_poolmanager(self, *args, **kwargs):
+        kwargs['socket_options'] = [(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)]
+        super().init_poolmanager(*args, **kwargs)
+
+
+_retry = Retry(
+    total=3,
+    backoff_factor=0.3,
+    status_forcelist=[429, 500, 502, 503, 504],
+    respect_retry_after_header=True
+)
+_adapter = _LowLatencyAdapter(pool_connections=20, pool_maxsize=50, max_retries=_retry)
+
+_session = requests.Session()
+_session.mount('https://', _adapter)
+_session.mount('http://', _adapter)
+_session.headers.update({
+    'User-Agent': 'moondev-polymarket/1.0',
+    'Accept-Encoding': 'gzip, deflate, br',
+    'Connection': 'keep-alive'
+})
+
+
+class _RateLimiter:
+    """Per-endpoint token buckets sized to Polymarket's 10-second windows
+
+    Waiting up front for a token is far cheaper than eating a 429 and the
+    server-imposed backoff that comes with it.
+    """
+
+    # endpoint -> (tokens per second, bucket capacity)
+    BUCKETS = {
+        '/markets': (50.0, 500),
+        '/events': (50.0, 500),
+        '/trades': (50.0, 500),
+    }
+    DEFAULT = (10.0, 100)
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._state = {}  # endpoint -> [tokens, last_refill]
+
+    def acquire(self, endpoint: str) -> float:
+        """Take a token for endpoint, returning seconds to sleep (0 if none)"""
+        rate, capacity = self.BUCKETS.get(endpoint, self.DEFAULT)
+        now = time.monotonic()
+
+        with self._lock:
+            tokens, last = self._state.get(endpoint, (capacity, now))
+            tokens = min(capacity, tokens + (now - last) * rate)
+
+            if tokens >= 1.0:
+                self._state[endpoint] = (tokens - 1.0, now)
+                return 0.0
+
+            # Bucket empty - caller sleeps until one token refills
+            wait = (1.0 - tokens) / rate
+            self._state[endpoint] = (0.0, now + wait)
+            return wait
+
+
+_limiter = _RateLimiter()
+
+
+def _throttled_get(url: str, endpoint: str, **kwargs):
+    """Session GET gated by the per-endpoint token bucket"""
+    wait = _limiter.acquire(endpoint)
+    if wait:
+        time.sleep(wait)
+    return _session.get(url, **kwargs)
+
+
+# TTL caches - market metadata barely changes (minutes), prices change fast
+# (seconds), so each gets a TTL matched to how stale we can afford to be
+_markets_cache = TTLCache(maxsize=16, ttl=300)    # limit -> markets list/df
+_slug_cache = TTLCache(maxsize=1024, ttl=600)     # slug -> market dict
+_prices_cache = TTLCache(maxsize=2048, ttl=2)     # condition_id -> prices
+_book_cache = TTLCache(maxsize=1024, ttl=0.5)     # token_id -> order book
+_cache_lock = threading.Lock()
+
+
+def invalidate_market(condition_id: str):
+    """Drop a market's cached prices (call after trading against it)"""
+    with _cache_lock:
+        _prices_cache.pop(condition_id, None)
+
 # Initialize client (will be None if paper trading or credentials missing)
 if PAPER_TRADING_ENABLED:
     poly_client = None
@@ -96,6 +231,67 @@ else:
 # MARKET DATA FUNCTIONS
 # ==============================================================================
 
+# Numeric columns coerced up front so downstream filters and arithmetic run
+# on contiguous float arrays instead of object-dtype boxes
+_MARKET_NUMERIC_COLS = ('volume', 'liquidity', 'yes_price', 'no_price')
+
+# The only market-record fields this module actually reads - requesting and
+# keeping just these cuts payload bytes and JSON parse work on the 500-row
+# markets page
+_MARKET_FIELDS = ('question', 'slug', 'volume', 'liquidity', 'conditionId',
+                  'condition_id', 'active', 'outcome_prices')
+
+# Compiled once for outcome classification - skips the per-call lower()
+# allocation, and the word boundary keeps 'eyes'/'noyes' from matching
+_YES_RE = re.compile(r'\byes\b', re.IGNORECASE)
+_NO_RE = re.compile(r'\bno\b', re.IGNORECASE)
+_TRADE_NUMERIC_COLS = ('price', 'size')
+# 'outcome' stays plain text - get_position_for_market fillna('')s it,
+# which a categorical without an '' category would reject
+_CATEGORY_COLS = ('side',)
+
+
+@dataclass(slots=True)
+class MarketPrices:
+    """Price snapshot for one market - slotted, so no per-instance dict
+
+    Position-scanning loops build lots of these; attribute access is
+    faster than dict key hashing and the record is roughly half the size.
+    """
+    yes_price: float = 0.0
+    no_price: float = 0.0
+    yes_bid: Optional[float] = None
+    no_bid: Optional[float] = None
+    volume_24h: float = 0.0
+    liquidity: float = 0.0
+
+    def __getitem__(self, key):
+        # Backward compat for callers still doing prices['yes_price']
+        return getattr(self, key)
+
+    def to_dict(self) -> Dict:
+        return asdict(self)
+
+
+def _to_float_array(xs) -> np.ndarray:
+    """Parse a sequence of numeric strings to float64 in one C-level pass
+
+    Use this when handling collected price/size lists instead of calling
+    float() per element - numpy does the string parsing without boxing.
+    """
+    return np.asarray(xs, dtype=np.float64)
+
+
+def _coerce_dtypes(df: pd.DataFrame, numeric_cols: tuple) -> pd.DataFrame:
+    """Coerce numeric columns to float and repeated text to category"""
+    for c in numeric_cols:
+        if c in df:
+            df[c] = pd.to_numeric(df[c], errors='coerce', downcast='float')
+    for c in _CATEGORY_COLS:
+        if c in df:
+            df[c] = df[c].astype('category')
+    return df
+
 def get_all_markets(limit: int = 100) -> pd.DataFrame:
     """
     Fetch all active Polymarket markets
@@ -106,27 +302,59 @@ def get_all_markets(limit: int = 100) -> pd.DataFrame:
     Returns:
         DataFrame with market information
     """
+    markets = _get_markets_raw(limit)
+
+    if not markets:
+        _pretty("⚠️ No markets found", "yellow")
+        return pd.DataFrame()
+
+    df = _coerce_dtypes(pd.DataFrame(markets), _MARKET_NUMERIC_COLS)
+    _pretty(f"✅ Fetched {len(df)} active markets", "green")
+
+    return df
+
+
+def _get_markets_raw(limit: int = 500) -> List[Dict]:
+    """Fetch active markets as the raw JSON list (TTL-cached)
+
+    Callers that only need a handful of rows (search) can filter the list
+    directly instead of paying for a 500-row DataFrame first.
+    """
+    with _cache_lock:
+        cached = _markets_cache.get(limit)
+    if cached is not None:
+        return cached
+
     try:
         url = f"{GAMMA_API}/markets"
-        params = {"limit": limit, "active": "true"}
-        
-        response = requests.get(url, params=params, timeout=30)
+        params = {
+            "limit": limit,
+            "active": "true",
+            # Ask the server to project down to the fields we use; harmless
+            # where unsupported, and we prune client-side either way
+            "fields": ",".join(_MARKET_FIELDS)
+        }
+
+        response = _throttled_get(url, '/markets', params=params, timeout=30)
         response.raise_for_status()
-        
-        markets = response.json()
-        
-        if not markets:
-            cprint("⚠️ No markets found", "yellow")
-            return pd.DataFrame()
-        
-        df = pd.DataFrame(markets)
-        cprint(f"✅ Fetched {len(df)} active markets", "green")
-        
-        return df
-        
+
+        markets = _parse_response(response)
+
+        # Prune to the fields this module reads - no point carrying dozens
+        # of unused keys per market through caches and DataFrames
+        markets = [
+            {k: m[k] for k in _MARKET_FIELDS if k in m}
+            for m in markets
+        ]
+
+        with _cache_lock:
+            _markets_cache[limit] = markets
+
+        return markets
+
     except Exception as e:
-        cprint(f"❌ Error fetching markets: {e}", "red")
-        return pd.DataFrame()
+        _pretty(f"❌ Error fetching markets: {e}", "red")
+        return []
 
 
 def get_market_by_slug(slug: str) -> Dict:
@@ -139,58 +367,99 @@ def get_market_by_slug(slug: str) -> Dict:
     Returns:
         Dictionary with market details
     """
+    with _cache_lock:
+        cached = _slug_cache.get(slug)
+    if cached is not None:
+        return cached
+
     try:
         url = f"{GAMMA_API}/events/{slug}"
-        
-        response = requests.get(url, timeout=30)
+
+        response = _throttled_get(url, '/events', timeout=30)
         response.raise_for_status()
-        
-        market_data = response.json()
-        
-        cprint(f"✅ Fetched market: {market_data.get('title', 'Unknown')}", "green")
-        
+
+        market_data = _parse_response(response)
+
+        _pretty(f"✅ Fetched market: {market_data.get('title', 'Unknown')}", "green")
+
+        with _cache_lock:
+            _slug_cache[slug] = market_data
+
         return market_data
         
     except Exception as e:
-        cprint(f"❌ Error fetching market {slug}: {e}", "red")
+        _pretty(f"❌ Error fetching market {slug}: {e}", "red")
         return {}
 
 
-def get_market_prices(condition_id: str) -> Dict:
+def get_market_prices(condition_id: str) -> MarketPrices:
     """
     Get current YES/NO prices for a market
     
     Args:
         condition_id: Market condition ID
-    
+
     Returns:
-        Dictionary with YES and NO prices
+        MarketPrices record with YES/NO prices (dict-style access still
+        works for legacy callers)
     """
+    with _cache_lock:
+        cached = _prices_cache.get(condition_id)
+    if cached is not None:
+        return cached
+
     try:
         url = f"{DATA_API}/markets/{condition_id}"
-        
-        response = requests.get(url, timeout=30)
+
+        response = _throttled_get(url, '/markets', timeout=30)
         response.raise_for_status()
         
-        data = response.json()
+        data = _parse_response(response)
         
         # Extract YES/NO prices
-        prices = {
-            "yes_price": float(data.get("outcome_prices", ["0", "0"])[0]),
-            "no_price": float(data.get("outcome_prices", ["0", "0"])[1]),
-            "yes_bid": None,  # Would need order book for this
-            "no_bid": None,
-            "volume_24h": float(data.get("volume", 0)),
-            "liquidity": float(data.get("liquidity", 0))
-        }
-        
-        cprint(f"💰 YES: ${prices['yes_price']:.3f} | NO: ${prices['no_price']:.3f}", "cyan")
-        
+        outcome_prices = _to_float_array(data.get("outcome_prices", ["0", "0"])[:2])
+        prices = MarketPrices(
+            yes_price=float(outcome_prices[0]),
+            no_price=float(outcome_prices[1]),
+            yes_bid=None,  # Would need order book for this
+            no_bid=None,
+            volume_24h=float(data.get("volume", 0)),
+            liquidity=float(data.get("liquidity", 0))
+        )
+
+        _pretty(f"💰 YES: ${prices.yes_price:.3f} | NO: ${prices.no_price:.3f}", "cyan")
+
+        with _cache_lock:
+            _prices_cache[condition_id] = prices
+
         return prices
         
     except Exception as e:
-        cprint(f"❌ Error fetching prices: {e}", "red")
-        return {"yes_price": 0, "no_price": 0}
+        _pretty(f"❌ Error fetching prices: {e}", "red")
+        return MarketPrices()
+
+
+def get_market_prices_batch(condition_ids: List[str]) -> Dict[str, MarketPrices]:
+    """
+    Fetch prices for many markets concurrently
+
+    Sequential price lookups pay one round-trip each - running them on a
+    small thread pool over the shared session turns sum-of-latencies into
+    max-of-latencies.
+
+    Args:
+        condition_ids: List of market condition IDs
+
+    Returns:
+        Dictionary mapping condition_id -> MarketPrices record
+    """
+    if not condition_ids:
+        return {}
+
+    with ThreadPoolExecutor(max_workers=8) as executor:
+        results = executor.map(get_market_prices, condition_ids)
+
+    return dict(zip(condition_ids, results))
 
 
 def get_order_book(token_id: str) -> Dict:
@@ -204,21 +473,36 @@ def get_order_book(token_id: str) -> Dict:
         Dictionary with bids and asks
     """
     if not poly_client:
-        cprint("❌ Polymarket client not initialized", "red")
+        _pretty("❌ Polymarket client not initialized", "red")
         return {}
-    
+
+    # Top-of-book only needs to be ~fresh - a 500ms cache means a market
+    # order right after a price check skips the second round-trip
+    with _cache_lock:
+        cached = _book_cache.get(token_id)
+    if cached is not None:
+        return cached
+
     try:
         order_book = poly_client.get_order_book(token_id)
-        
-        cprint(f"📊 Order book fetched for token {token_id[:8]}...", "green")
-        
+
+        _pretty(f"📊 Order book fetched for token {token_id[:8]}...", "green")
+
+        with _cache_lock:
+            _book_cache[token_id] = order_book
+
         return order_book
         
     except Exception as e:
-        cprint(f"❌ Error fetching order book: {e}", "red")
+        _pretty(f"❌ Error fetching order book: {e}", "red")
         return {}
 
 
+def prime_order_book(token_id: str):
+    """Pre-fetch a token's order book so the next market order hits cache"""
+    get_order_book(token_id)
+
+
 def search_markets(query: str, limit: int = 10) -> pd.DataFrame:
     """
     Search for markets by keyword
@@ -231,21 +515,44 @@ def search_markets(query: str, limit: int = 10) -> pd.DataFrame:
         DataFrame with matching markets
     """
     try:
-        all_markets = get_all_markets(limit=500)
-        
-        if all_markets.empty:
-            return pd.DataFrame()
-        
-        # Filter by query in title or description
-        mask = all_markets['question'].str.contains(query, case=False, na=False)
-        results = all_markets[mask].head(limit)
-        
-        cprint(f"🔍 Found {len(results)} markets matching '{query}'", "cyan")
-        
+        # Push the text predicate server-side first - the response then
+        # scales with the result size instead of the 500-market page
+        raw = None
+        try:
+            response = _throttled_get(
+                f"{GAMMA_API}/markets", '/markets',
+                params={"limit": limit, "active": "true", "q": query},
+                timeout=30
+            )
+            response.raise_for_status()
+            raw = _parse_response(response)
+        except Exception:
+            pass
+
+        q = query.casefold()
+
+        def _matches(m):
+            return q in (m.get('question') or '').casefold()
+
+        # Re-check the predicate client-side. If any returned row fails it,
+        # the server ignored the q param and just sent the most recent
+        # listings - treat that the same as no response, otherwise search
+        # silently shrinks to "match against the newest `limit` markets"
+        hits = [m for m in raw if _matches(m)][:limit] if raw else []
+        if not hits or len(hits) < len(raw[:limit]):
+            # Server-side search unavailable or ignored - filter the cached page
+            raw = _get_markets_raw(limit=500)
+            if not raw:
+                return pd.DataFrame()
+            hits = [m for m in raw if _matches(m)][:limit]
+        results = _coerce_dtypes(pd.DataFrame.from_records(hits), _MARKET_NUMERIC_COLS)
+
+        _pretty(f"🔍 Found {len(results)} markets matching '{query}'", "cyan")
+
         return results
         
     except Exception as e:
-        cprint(f"❌ Error searching markets: {e}", "red")
+        _pretty(f"❌ Error searching markets: {e}", "red")
         return pd.DataFrame()
 
 
@@ -253,6 +560,24 @@ def search_markets(query: str, limit: int = 10) -> pd.DataFrame:
 # ORDER PLACEMENT FUNCTIONS
 # ==============================================================================
 
+# Paper engine resolved once on first use - importing it loads CSV state,
+# so re-running the import machinery inside every order call is wasted work
+_paper_engine = None
+_paper_engine_loaded = False
+
+
+def _get_paper_engine():
+    """Import and cache the paper trading engine (None if unavailable)"""
+    global _paper_engine, _paper_engine_loaded
+    if not _paper_engine_loaded:
+        _paper_engine_loaded = True
+        try:
+            from src.paper_trading_polymarket import paper_engine
+            _paper_engine = paper_engine
+        except ImportError:
+            _paper_engine = None
+    return _paper_engine
+
 def place_limit_order(
     token_id: str,
     price: float,
@@ -279,25 +604,21 @@ def place_limit_order(
     """
     # 🎯 PAPER TRADING MODE - Route to paper trading engine
     if PAPER_TRADING_ENABLED:
-        try:
-            from src.paper_trading_polymarket import paper_engine
-            
-            if paper_engine:
-                return paper_engine.place_order(
-                    market_slug=market_slug or "unknown",
-                    market_title=market_title or "Unknown Market",
-                    token_id=token_id,
-                    side=side,
-                    price=price,
-                    size=size,
-                    order_type="LIMIT",
-                    notes=notes
-                )
-            else:
-                cprint("⚠️ Paper trading engine not initialized", "yellow")
-                return None
-        except ImportError:
-            cprint("⚠️ Paper trading module not available", "yellow")
+        paper_engine = _get_paper_engine()
+
+        if paper_engine:
+            return paper_engine.place_order(
+                market_slug=market_slug or "unknown",
+                market_title=market_title or "Unknown Market",
+                token_id=token_id,
+                side=side,
+                price=price,
+                size=size,
+                order_type="LIMIT",
+                notes=notes
+            )
+        else:
+            cprint("⚠️ Paper trading engine not available", "yellow")
             return None
     
     # LIVE TRADING MODE
@@ -368,23 +689,20 @@ def place_market_order(
         # For paper trading, use mid-price or assume reasonable price
         simulated_price = 0.50  # Default to 50/50 odds if we can't get real price
         
-        try:
-            from src.paper_trading_polymarket import paper_engine
-            
-            if paper_engine:
-                return paper_engine.place_order(
-                    market_slug=market_slug or "unknown",
-                    market_title=market_title or "Unknown Market",
-                    token_id=token_id,
-                    side=side,
-                    price=simulated_price,
-                    size=size,
-                    order_type="MARKET",
-                    notes=notes or "Market order (simulated price)"
-                )
-        except ImportError:
-            pass
-        
+        paper_engine = _get_paper_engine()
+
+        if paper_engine:
+            return paper_engine.place_order(
+                market_slug=market_slug or "unknown",
+                market_title=market_title or "Unknown Market",
+                token_id=token_id,
+                side=side,
+                price=simulated_price,
+                size=size,
+                order_type="MARKET",
+                notes=notes or "Market order (simulated price)"
+            )
+
         cprint("⚠️ Paper trading - market order simulated at $0.50", "yellow")
         return None
     
@@ -483,13 +801,18 @@ def cancel_all_orders(market_id: Optional[str] = None) -> int:
             orders = [o for o in orders if o.get("market") == market_id]
         
         cprint(f"🚫 Cancelling {len(orders)} orders...", "yellow")
-        
-        cancelled = 0
-        for order in orders:
-            order_id = order.get("id", "")
-            if cancel_order(order_id):
-                cancelled += 1
-        
+
+        order_ids = [o.get("id", "") for o in orders]
+
+        # One batch call beats N sequential round-trips; fall back to a
+        # thread pool if the client doesn't expose the batch endpoint
+        try:
+            resp = poly_client.cancel_orders(order_ids)
+            cancelled = len(resp.get("canceled", order_ids))
+        except AttributeError:
+            with ThreadPoolExecutor(max_workers=10) as executor:
+                cancelled = sum(executor.map(cancel_order, order_ids))
+
         cprint(f"✅ Cancelled {cancelled}/{len(orders)} orders", "green")
         
         return cancelled
@@ -512,32 +835,29 @@ def get_positions() -> pd.DataFrame:
     """
     # 🎯 PAPER TRADING MODE
     if PAPER_TRADING_ENABLED:
-        try:
-            from src.paper_trading_polymarket import paper_engine
-            
-            if paper_engine:
-                return paper_engine.positions_df
-        except ImportError:
-            pass
-        
-        cprint("📭 No positions (paper trading)", "yellow")
+        paper_engine = _get_paper_engine()
+
+        if paper_engine:
+            return paper_engine.positions_df
+
+        _pretty("📭 No positions (paper trading)", "yellow")
         return pd.DataFrame()
     
     # LIVE TRADING MODE
     if not poly_client:
-        cprint("❌ Polymarket client not initialized", "red")
+        _pretty("❌ Polymarket client not initialized", "red")
         return pd.DataFrame()
     
     try:
         positions = poly_client.get_positions()
         
         if not positions:
-            cprint("📭 No open positions", "yellow")
+            _pretty("📭 No open positions", "yellow")
             return pd.DataFrame()
         
-        df = pd.DataFrame(positions)
-        
-        cprint(f"✅ Found {len(df)} open positions", "green")
+        df = _coerce_dtypes(pd.DataFrame(positions), _TRADE_NUMERIC_COLS)
+
+        _pretty(f"✅ Found {len(df)} open positions", "green")
         
         # Calculate USD values if possible
         if 'size' in df.columns and 'price' in df.columns:
@@ -546,7 +866,7 @@ def get_positions() -> pd.DataFrame:
         return df
         
     except Exception as e:
-        cprint(f"❌ Error fetching positions: {e}", "red")
+        _pretty(f"❌ Error fetching positions: {e}", "red")
         return pd.DataFrame()
 
 
@@ -567,33 +887,30 @@ def get_position_for_market(condition_id: str) -> Dict:
     
     # Filter by market
     market_positions = positions[positions['market'] == condition_id]
-    
-    yes_shares = 0
-    no_shares = 0
-    
-    for _, pos in market_positions.iterrows():
-        outcome = pos.get('outcome', '')
-        size = float(pos.get('size', 0))
-        
-        if 'yes' in outcome.lower():
-            yes_shares = size
-        elif 'no' in outcome.lower():
-            no_shares = size
+
+    # One vectorized pass over the outcome/size columns instead of a
+    # per-row iterrows loop building a Series for every position
+    sizes = pd.to_numeric(market_positions['size'], errors='coerce').fillna(0)
+    outcomes = market_positions['outcome'].fillna('')
+
+    yes_mask = outcomes.str.contains(_YES_RE)
+    yes_shares = float(sizes[yes_mask].sum())
+    no_shares = float(sizes[~yes_mask & outcomes.str.contains(_NO_RE)].sum())
     
     # Get current prices
     prices = get_market_prices(condition_id)
     
-    total_value = (yes_shares * prices['yes_price']) + (no_shares * prices['no_price'])
+    total_value = (yes_shares * prices.yes_price) + (no_shares * prices.no_price)
     
     position_info = {
         "yes_shares": yes_shares,
         "no_shares": no_shares,
-        "yes_value": yes_shares * prices['yes_price'],
-        "no_value": no_shares * prices['no_price'],
+        "yes_value": yes_shares * prices.yes_price,
+        "no_value": no_shares * prices.no_price,
         "total_value": total_value
     }
     
-    cprint(f"📊 Position: {yes_shares:.2f} YES | {no_shares:.2f} NO | ${total_value:.2f} total", "cyan")
+    _pretty(f"📊 Position: {yes_shares:.2f} YES | {no_shares:.2f} NO | ${total_value:.2f} total", "cyan")
     
     return position_info
 
@@ -635,25 +952,31 @@ def close_position(condition_id: str, side: str = "ALL") -> bool:
     return success
 
 
+# Balance cache - balance barely moves second-to-second, so concurrent copy
+# evaluations shouldn't each pay a round-trip for it
+_balance_cache = None  # (balance, expiry via time.monotonic)
+_BALANCE_TTL = 10.0
+
+
 def get_balance() -> float:
     """
     Get USDC balance available for trading
-    
+
+    Live balances are cached for 10 seconds so bursts of concurrent
+    trade evaluations share one lookup.
+
     Returns:
         USDC balance as float
     """
     # 🎯 PAPER TRADING MODE
     if PAPER_TRADING_ENABLED:
-        try:
-            from src.paper_trading_polymarket import paper_engine
-            
-            if paper_engine:
-                balance = paper_engine.balance
-                cprint(f"💰 Paper trading balance: ${balance:,.2f} USDC (simulated)", "cyan")
-                return balance
-        except ImportError:
-            pass
-        
+        paper_engine = _get_paper_engine()
+
+        if paper_engine:
+            balance = paper_engine.balance
+            cprint(f"💰 Paper trading balance: ${balance:,.2f} USDC (simulated)", "cyan")
+            return balance
+
         cprint("💰 Paper trading balance: $10,000.00 USDC (default)", "cyan")
         return 10000.0
     
@@ -661,14 +984,21 @@ def get_balance() -> float:
     if not poly_client:
         cprint("❌ Polymarket client not initialized", "red")
         return 0.0
-    
+
+    global _balance_cache
+    now = time.monotonic()
+    if _balance_cache and _balance_cache[1] > now:
+        return _balance_cache[0]
+
     try:
         balance_response = poly_client.get_balance_allowance()
-        
+
         balance = float(balance_response.get("balance", 0)) / 1e6  # Convert from USDC units
-        
+
         cprint(f"💰 Available balance: ${balance:,.2f} USDC", "green")
-        
+
+        _balance_cache = (balance, now + _BALANCE_TTL)
+
         return balance
         
     except Exception as e:
@@ -703,70 +1033,94 @@ def get_recent_trades(
             "limit": limit
         }
         
-        response = requests.get(url, params=params, timeout=30)
+        response = _throttled_get(url, '/trades', params=params, timeout=30)
         response.raise_for_status()
-        
-        trades = response.json()
+
+        trades = _parse_response(response)
         
         if not trades:
-            cprint("⚠️ No trades found", "yellow")
+            _pretty("⚠️ No trades found", "yellow")
             return pd.DataFrame()
         
-        df = pd.DataFrame(trades)
-        
-        # Calculate USD value
+        df = _coerce_dtypes(pd.DataFrame(trades), _TRADE_NUMERIC_COLS)
+
+        # Calculate USD value on contiguous float arrays - one numpy
+        # multiply instead of two astype passes over object dtype
         if 'price' in df.columns and 'size' in df.columns:
-            df['usd_value'] = df['price'].astype(float) * df['size'].astype(float)
+            usd = df['price'].to_numpy() * df['size'].to_numpy()
+            df['usd_value'] = usd
         else:
-            df['usd_value'] = 0
-        
+            usd = np.zeros(len(df))
+            df['usd_value'] = 0.0
+
         # Filter for whale trades
-        whale_trades = df[df['usd_value'] >= min_size_usd]
+        whale_trades = df.iloc[np.flatnonzero(usd >= min_size_usd)]
         
-        cprint(f"🐋 Found {len(whale_trades)} whale trades (>${min_size_usd:,.0f})", "cyan")
+        _pretty(f"🐋 Found {len(whale_trades)} whale trades (>${min_size_usd:,.0f})", "cyan")
         
         return whale_trades
         
     except Exception as e:
-        cprint(f"❌ Error fetching trades: {e}", "red")
+        _pretty(f"❌ Error fetching trades: {e}", "red")
         return pd.DataFrame()
 
 
+# Trader stats cache - whales trade in bursts, so re-fetching their stats on
+# every trade is wasted round-trips. Entries live for 5 minutes.
+_trader_stats_cache = {}
+_trader_stats_lock = threading.Lock()
+_STATS_TTL = 300.0
+_STATS_CACHE_MAX = 10000
+
+
 def get_trader_stats(wallet_address: str) -> Dict:
     """
     Get statistics for a specific trader (via PredictFolio API)
-    
+
+    Results are cached in-process for 5 minutes per wallet so repeat
+    trades from the same whale don't trigger repeat HTTP lookups.
+
     Args:
         wallet_address: Trader's wallet address
-    
+
     Returns:
         Dictionary with trader statistics
     """
+    now = time.monotonic()
+    hit = _trader_stats_cache.get(wallet_address)
+    if hit and hit[1] > now:
+        return hit[0]
+
     try:
         # PredictFolio API endpoint (hypothetical - adjust based on actual API)
         url = f"https://api.predictfolio.com/traders/{wallet_address}"
-        
-        response = requests.get(url, timeout=30)
+
+        response = _throttled_get(url, '/traders', timeout=30)
         
         if response.status_code == 200:
-            stats = response.json()
+            stats = _parse_response(response)
             
             win_rate = stats.get('win_rate', 0)
             total_volume = stats.get('total_volume', 0)
             profit_loss = stats.get('profit_loss', 0)
             
-            cprint(f"📊 Trader Stats:", "cyan")
-            cprint(f"   Win Rate: {win_rate:.1f}%", "cyan")
-            cprint(f"   Total Volume: ${total_volume:,.2f}", "cyan")
-            cprint(f"   P&L: ${profit_loss:,.2f}", "green" if profit_loss > 0 else "red")
-            
+            _pretty(f"📊 Trader Stats:", "cyan")
+            _pretty(f"   Win Rate: {win_rate:.1f}%", "cyan")
+            _pretty(f"   Total Volume: ${total_volume:,.2f}", "cyan")
+            _pretty(f"   P&L: ${profit_loss:,.2f}", "green" if profit_loss > 0 else "red")
+
+            with _trader_stats_lock:
+                if len(_trader_stats_cache) >= _STATS_CACHE_MAX:
+                    _trader_stats_cache.pop(next(iter(_trader_stats_cache)))
+                _trader_stats_cache[wallet_address] = (stats, now + _STATS_TTL)
+
             return stats
         else:
-            cprint(f"⚠️ Could not fetch trader stats", "yellow")
+            _pretty(f"⚠️ Could not fetch trader stats", "yellow")
             return {}
         
     except Exception as e:
-        cprint(f"❌ Error fetching trader stats: {e}", "red")
+        _pretty(f"❌ Error fetching trader stats: {e}", "red")
         return {}
 
 
@@ -848,24 +1202,23 @@ def ai_validate_trade(
         # Query swarm
         result = swarm.query(prompt=prompt)
         
-        # Count votes
-        yes_votes = 0
-        no_votes = 0
-        total_votes = 0
-        
-        for model_name, model_data in result.get('responses', {}).items():
-            if model_data.get('success'):
-                response = model_data.get('response', '').upper()
-                total_votes += 1
-                
-                if 'YES' in response and 'NO' not in response:
-                    yes_votes += 1
-                elif 'NO' in response:
-                    no_votes += 1
-        
+        # Count votes - C-level char ops over all responses at once
+        responses = [
+            m.get('response', '') for m in result.get('responses', {}).values()
+            if m.get('success')
+        ]
+        total_votes = len(responses)
+
         if total_votes == 0:
             cprint("❌ No AI responses received", "red")
             return False
+
+        up = np.char.upper(np.asarray(responses, dtype=str))
+        yes_mask = np.char.find(up, 'YES') >= 0
+        no_mask = np.char.find(up, 'NO') >= 0
+
+        yes_votes = int((yes_mask & ~no_mask).sum())
+        no_votes = int(no_mask.sum())
         
         consensus = yes_votes / total_votes
         
@@ -885,6 +1238,23 @@ def ai_validate_trade(
         return False
 
 
+async def ai_validate_trade_async(
+    market_slug: str,
+    side: str,
+    confidence_threshold: float = 0.6
+) -> bool:
+    """
+    Async wrapper around ai_validate_trade for event-loop callers
+
+    SwarmAgent.query already fans the model calls out on a thread pool,
+    so swarm latency is max-of-models, not sum - this wrapper just keeps
+    that blocking round trip off the caller's event loop.
+    """
+    return await asyncio.to_thread(
+        ai_validate_trade, market_slug, side, confidence_threshold
+    )
+
+
 # ==============================================================================
 # UTILITY FUNCTIONS
 # ==============================================================================
@@ -912,7 +1282,7 @@ def print_market_summary(market_data: Dict):
     condition_id = market_data.get('condition_id', '')
     if condition_id:
         prices = get_market_prices(condition_id)
-        cprint(f"📈 YES: ${prices['yes_price']:.3f} | NO: ${prices['no_price']:.3f}", "green")
+        cprint(f"📈 YES: ${prices.yes_price:.3f} | NO: ${prices.no_price:.3f}", "green")
     
     cprint("="*80 + "\n", "cyan")
 
@@ -15,8 +15,13 @@ All "trades" are recorded to CSV with hypothetical P&L tracking.
 """
 
 import os
+import io
 import sys
-import json
+import csv
+import atexit
+import queue
+import threading
+import numpy as np
 import pandas as pd
 from datetime import datetime
 from pathlib import Path
@@ -42,10 +47,94 @@ PAPER_DATA_FOLDER = os.path.join(project_root, "src/data/polymarket_paper_tradin
 PAPER_TRADES_CSV = os.path.join(PAPER_DATA_FOLDER, "paper_trades.csv")
 PAPER_POSITIONS_CSV = os.path.join(PAPER_DATA_FOLDER, "paper_positions.csv")
 PAPER_BALANCE_CSV = os.path.join(PAPER_DATA_FOLDER, "paper_balance.csv")
+# Typed, compressed snapshots - ~10x faster to load than re-parsing the
+# CSVs and the dtypes round-trip without inference. The CSVs stay as the
+# append journal (and human-readable backup).
+PAPER_TRADES_PARQUET = os.path.join(PAPER_DATA_FOLDER, "paper_trades.parquet")
+PAPER_POSITIONS_PARQUET = os.path.join(PAPER_DATA_FOLDER, "paper_positions.parquet")
 
 # Create data folder
 os.makedirs(PAPER_DATA_FOLDER, exist_ok=True)
 
+# Column orders for the CSV files and lazily-built DataFrames
+TRADE_COLUMNS = [
+    'timestamp', 'trade_id', 'market_slug', 'market_title',
+    'side', 'token_id', 'price', 'size', 'usd_value',
+    'order_type', 'status', 'pnl', 'notes'
+]
+POSITION_COLUMNS = [
+    'market_slug', 'market_title', 'token_id', 'side',
+    'entry_price', 'current_price', 'shares', 'entry_value',
+    'current_value', 'unrealized_pnl', 'opened_at'
+]
+BALANCE_COLUMNS = ['timestamp', 'balance', 'total_pnl']
+
+# Banner separator built once instead of a string-multiply per print
+_SEP80 = "=" * 80
+
+# Precomputed ANSI codes for the buffered performance report
+_ANSI = {
+    'cyan': '\x1b[36m', 'green': '\x1b[32m', 'red': '\x1b[31m',
+    'yellow': '\x1b[33m', 'white': '\x1b[37m',
+    'bold': '\x1b[1m', 'on_cyan': '\x1b[46m', 'reset': '\x1b[0m',
+}
+_COLORS_ENABLED = 'NO_COLOR' not in os.environ
+
+# Bound once - skips the module attribute lookup on every clock read
+_now = datetime.now
+
+# Explicit load dtypes - low-cardinality strings as category, floats
+# downcast to float32. Pandas would otherwise infer object/float64 for
+# everything, roughly quadrupling the per-row memory footprint.
+TRADE_DTYPES = {
+    'market_slug': 'category', 'market_title': 'string',
+    'token_id': 'category', 'side': 'category',
+    'order_type': 'category', 'status': 'category',
+    'price': 'float32', 'size': 'float32',
+    'usd_value': 'float32', 'pnl': 'float32',
+}
+POSITION_DTYPES = {
+    'market_slug': 'category', 'market_title': 'string',
+    'token_id': 'category', 'side': 'category',
+    'entry_price': 'float32', 'current_price': 'float32',
+    'shares': 'float32', 'entry_value': 'float32',
+    'current_value': 'float32', 'unrealized_pnl': 'float32',
+}
+
+
+def df_shrink(df: pd.DataFrame) -> pd.DataFrame:
+    """Downcast numeric columns in place to the smallest dtype that fits"""
+    for col in df.select_dtypes(include='float').columns:
+        df[col] = pd.to_numeric(df[col], downcast='float')
+    for col in df.select_dtypes(include='integer').columns:
+        df[col] = pd.to_numeric(df[col], downcast='integer')
+    return df
+
+
+def _append_row(path: str, row_dict: Dict, header_cols):
+    """Append one row to a CSV without rewriting the file
+
+    Per-order df.to_csv(path) rewrites the whole history every time, so
+    write cost grows with session length. Appending keeps it O(1) per
+    order - the in-memory DataFrames stay the source of truth and only
+    get snapshotted in full when something is rewritten in place.
+    """
+    write_header = not os.path.exists(path)
+
+    with open(path, "a", newline="", buffering=1 << 16) as f:
+        writer = csv.DictWriter(f, fieldnames=header_cols, extrasaction='ignore')
+        if write_header:
+            writer.writeheader()
+        writer.writerow(row_dict)
+
+def _snapshot_parquet(path: str, rows, columns):
+    """Write a full typed snapshot of the rows as compressed parquet"""
+    try:
+        pd.DataFrame(list(rows), columns=columns).to_parquet(
+            path, compression='zstd', index=False)
+    except Exception as e:
+        cprint(f"⚠️ Error writing parquet snapshot {os.path.basename(path)}: {e}", "yellow")
+
 # ==============================================================================
 # PAPER TRADING ENGINE
 # ==============================================================================
@@ -53,119 +142,254 @@ os.makedirs(PAPER_DATA_FOLDER, exist_ok=True)
 class PaperTradingEngine:
     """Simulates Polymarket trading without real money"""
     
-    def __init__(self, starting_balance: float = PAPER_STARTING_BALANCE):
-        """Initialize paper trading engine"""
-        cprint("\n" + "="*80, "yellow")
-        cprint("📝 PAPER TRADING MODE - SIMULATION ONLY", "white", "on_yellow", attrs=['bold'])
-        cprint("⚠️  NO REAL MONEY WILL BE USED", "white", "on_yellow", attrs=['bold'])
-        cprint("="*80, "yellow")
+    def __init__(self, starting_balance: float = PAPER_STARTING_BALANCE, verbose: bool = True):
+        """Initialize paper trading engine
+
+        verbose=False silences the per-trade cprint output - backtest
+        loops spend more time formatting and printing than trading
+        otherwise. Errors always print.
+        """
+        self.verbose = verbose
+
+        if self.verbose:
+            cprint("\n" + _SEP80, "yellow")
+            cprint("📝 PAPER TRADING MODE - SIMULATION ONLY", "white", "on_yellow", attrs=['bold'])
+            cprint("⚠️  NO REAL MONEY WILL BE USED", "white", "on_yellow", attrs=['bold'])
+            cprint(_SEP80, "yellow")
         
         self.starting_balance = starting_balance
         self.balance = starting_balance
-        
-        # Load or initialize data
-        self.trades_df = self._load_trades()
-        self.positions_df = self._load_positions()
-        self.balance_history = self._load_balance_history()
-        
-        # Calculate current balance from trades
-        self._recalculate_balance()
-        
-        cprint(f"💰 Starting Balance: ${self.starting_balance:,.2f} USDC (simulated)", "cyan")
-        cprint(f"💵 Current Balance: ${self.balance:,.2f} USDC (simulated)", "green")
-        cprint(f"📊 Total Trades: {len(self.trades_df)}", "cyan")
-        cprint(f"📈 Open Positions: {len(self.positions_df)}", "cyan")
-        cprint("="*80 + "\n", "yellow")
+
+        # Dedup cache for market titles (sys.intern covers the short
+        # identifier-ish strings; titles are arbitrary text)
+        self._intern_cache = {}
+        
+        # Load existing data as plain row lists - appending a trade is then
+        # a list append instead of a full-DataFrame copy via pd.concat.
+        # trades_df/positions_df materialize frames on demand.
+        trades_df = self._load_trades()
+        self._trades_rows = trades_df.to_dict('records')
+        # Positions are keyed by (market_slug, token_id) - close/lookup is
+        # one dict access instead of a scan over every open position
+        self._positions = {
+            (p['market_slug'], p['token_id']): p
+            for p in self._load_positions().to_dict('records')
+        }
+        self._balance_rows = self._load_balance_history().to_dict('records')
+
+        # One-time migration: seed the parquet snapshot from an existing
+        # CSV-only history (the CSV is kept as backup/journal)
+        if self._trades_rows and not os.path.exists(PAPER_TRADES_PARQUET):
+            _snapshot_parquet(PAPER_TRADES_PARQUET, self._trades_rows, TRADE_COLUMNS)
+
+        # Trades are append-only on the hot path - keep one handle open and
+        # write just the new row per order. Closing a trade mutates history,
+        # which goes through the full rewrite in _save_trades instead.
+        trades_file_new = (not os.path.exists(PAPER_TRADES_CSV)
+                           or os.path.getsize(PAPER_TRADES_CSV) == 0)
+        self._trades_fh = open(PAPER_TRADES_CSV, 'a', newline='', buffering=1 << 16)
+        self._trades_writer = csv.DictWriter(
+            self._trades_fh, fieldnames=TRADE_COLUMNS, extrasaction='ignore')
+        if trades_file_new:
+            self._trades_writer.writeheader()
+            self._trades_fh.flush()
+
+        # All disk I/O runs on one background writer thread - the order
+        # path just enqueues rows and never blocks on the filesystem
+        self._write_q = queue.Queue()
+        self._closed = False
+        self._writer_thread = threading.Thread(target=self._writer_loop, daemon=True)
+        self._writer_thread.start()
+
+        # Seed the running P&L aggregates and win/loss counters with one
+        # vectorized pass over the just-loaded history - everything after
+        # this is updated incrementally on the order path
+        self.rebuild_state(trades_df)
+
+        if self.verbose:
+            cprint(f"💰 Starting Balance: ${self.starting_balance:,.2f} USDC (simulated)", "cyan")
+            cprint(f"💵 Current Balance: ${self.balance:,.2f} USDC (simulated)", "green")
+            cprint(f"📊 Total Trades: {len(self._trades_rows)}", "cyan")
+            cprint(f"📈 Open Positions: {len(self._positions)}", "cyan")
+            cprint(_SEP80 + "\n", "yellow")
+
+    @property
+    def trades_df(self) -> pd.DataFrame:
+        """Trade history materialized from the row store"""
+        return pd.DataFrame(self._trades_rows, columns=TRADE_COLUMNS)
+
+    @property
+    def positions_df(self) -> pd.DataFrame:
+        """Open positions materialized from the row store"""
+        return pd.DataFrame(list(self._positions.values()), columns=POSITION_COLUMNS)
+
+    @property
+    def balance_history(self) -> pd.DataFrame:
+        """Balance snapshots materialized from the row store"""
+        return pd.DataFrame(self._balance_rows, columns=BALANCE_COLUMNS)
     
+    @staticmethod
+    def _parquet_fresh(parquet_path: str, csv_path: str) -> bool:
+        """True when the parquet snapshot is at least as recent as the CSV journal"""
+        if not os.path.exists(parquet_path):
+            return False
+        if not os.path.exists(csv_path):
+            return True
+        return os.path.getmtime(parquet_path) >= os.path.getmtime(csv_path)
+
     def _load_trades(self) -> pd.DataFrame:
-        """Load paper trading history"""
+        """Load paper trading history (parquet snapshot when fresh, CSV otherwise)"""
+        if self._parquet_fresh(PAPER_TRADES_PARQUET, PAPER_TRADES_CSV):
+            try:
+                return pd.read_parquet(PAPER_TRADES_PARQUET)
+            except Exception as e:
+                cprint(f"⚠️ Error loading trades parquet: {e}", "yellow")
+
         if os.path.exists(PAPER_TRADES_CSV):
             try:
-                return pd.read_csv(PAPER_TRADES_CSV)
+                return pd.read_csv(PAPER_TRADES_CSV, dtype=TRADE_DTYPES)
             except Exception as e:
                 cprint(f"⚠️ Error loading trades: {e}", "yellow")
-        
-        return pd.DataFrame(columns=[
-            'timestamp', 'trade_id', 'market_slug', 'market_title',
-            'side', 'token_id', 'price', 'size', 'usd_value',
-            'order_type', 'status', 'pnl', 'notes'
-        ])
-    
+
+        return pd.DataFrame(columns=TRADE_COLUMNS)
+
     def _load_positions(self) -> pd.DataFrame:
-        """Load open positions"""
+        """Load open positions (parquet snapshot when fresh, CSV otherwise)"""
+        if self._parquet_fresh(PAPER_POSITIONS_PARQUET, PAPER_POSITIONS_CSV):
+            try:
+                return pd.read_parquet(PAPER_POSITIONS_PARQUET)
+            except Exception as e:
+                cprint(f"⚠️ Error loading positions parquet: {e}", "yellow")
+
         if os.path.exists(PAPER_POSITIONS_CSV):
             try:
-                return pd.read_csv(PAPER_POSITIONS_CSV)
+                return pd.read_csv(PAPER_POSITIONS_CSV, dtype=POSITION_DTYPES)
             except Exception as e:
                 cprint(f"⚠️ Error loading positions: {e}", "yellow")
-        
-        return pd.DataFrame(columns=[
-            'market_slug', 'market_title', 'token_id', 'side',
-            'entry_price', 'current_price', 'shares', 'entry_value',
-            'current_value', 'unrealized_pnl', 'opened_at'
-        ])
+
+        return pd.DataFrame(columns=POSITION_COLUMNS)
     
     def _load_balance_history(self) -> pd.DataFrame:
         """Load balance history"""
         if os.path.exists(PAPER_BALANCE_CSV):
             try:
-                return pd.read_csv(PAPER_BALANCE_CSV)
+                return df_shrink(pd.read_csv(PAPER_BALANCE_CSV))
             except Exception as e:
                 cprint(f"⚠️ Error loading balance history: {e}", "yellow")
         
-        return pd.DataFrame(columns=['timestamp', 'balance', 'total_pnl'])
+        return pd.DataFrame(columns=BALANCE_COLUMNS)
     
+    def _append_trade(self, trade: Dict):
+        """Queue the new trade row for the writer thread"""
+        self._write_q.put(('trade', dict(trade)))
+
     def _save_trades(self):
-        """Save trades to CSV"""
-        try:
-            self.trades_df.to_csv(PAPER_TRADES_CSV, index=False)
-        except Exception as e:
-            cprint(f"❌ Error saving trades: {e}", "red")
-    
+        """Queue a full trades rewrite (only needed when existing rows mutate)
+
+        Snapshots the rows on the calling thread so later mutations don't
+        race the writer.
+        """
+        self._write_q.put(('rewrite_trades', [dict(t) for t in self._trades_rows]))
+
     def _save_positions(self):
-        """Save positions to CSV"""
-        try:
-            self.positions_df.to_csv(PAPER_POSITIONS_CSV, index=False)
-        except Exception as e:
-            cprint(f"❌ Error saving positions: {e}", "red")
-    
-    def _save_balance(self):
-        """Save balance history to CSV"""
+        """Queue a full positions rewrite from the row store"""
+        self._write_q.put(('rewrite_positions', [dict(p) for p in self._positions.values()]))
+
+    def _save_balance(self, balance_update: Dict):
+        """Queue the latest balance snapshot"""
+        self._write_q.put(('balance', balance_update))
+
+    def _writer_loop(self):
+        """Background writer - owns every file handle after startup
+
+        Drains the queue and defers the trades-handle flush until a burst
+        of messages has been processed, so back-to-back orders cost one
+        flush instead of one each.
+        """
+        dirty = False
+        while True:
+            try:
+                tag, payload = self._write_q.get(timeout=0.05)
+            except queue.Empty:
+                if dirty:
+                    self._trades_fh.flush()
+                    dirty = False
+                continue
+
+            if tag is None:
+                break
+
+            try:
+                if tag == 'trade':
+                    self._trades_writer.writerow(payload)
+                    dirty = True
+                elif tag == 'position':
+                    _append_row(PAPER_POSITIONS_CSV, payload, POSITION_COLUMNS)
+                elif tag == 'balance':
+                    _append_row(PAPER_BALANCE_CSV, payload, BALANCE_COLUMNS)
+                elif tag == 'rewrite_trades':
+                    self._trades_fh.close()
+                    with open(PAPER_TRADES_CSV, 'w', newline='') as f:
+                        writer = csv.DictWriter(f, fieldnames=TRADE_COLUMNS, extrasaction='ignore')
+                        writer.writeheader()
+                        writer.writerows(payload)
+                    self._trades_fh = open(PAPER_TRADES_CSV, 'a', newline='', buffering=1 << 16)
+                    self._trades_writer = csv.DictWriter(
+                        self._trades_fh, fieldnames=TRADE_COLUMNS, extrasaction='ignore')
+                    dirty = False
+                    _snapshot_parquet(PAPER_TRADES_PARQUET, payload, TRADE_COLUMNS)
+                elif tag == 'rewrite_positions':
+                    with open(PAPER_POSITIONS_CSV, 'w', newline='') as f:
+                        writer = csv.DictWriter(f, fieldnames=POSITION_COLUMNS, extrasaction='ignore')
+                        writer.writeheader()
+                        writer.writerows(payload)
+                    _snapshot_parquet(PAPER_POSITIONS_PARQUET, payload, POSITION_COLUMNS)
+            except Exception as e:
+                cprint(f"❌ Writer thread error ({tag}): {e}", "red")
+            finally:
+                self._write_q.task_done()
+
+        if dirty:
+            self._trades_fh.flush()
+
+    def close(self):
+        """Drain pending writes, snapshot to parquet and stop the writer thread
+
+        Idempotent - registered with atexit for the global engine and also
+        called explicitly by agents on shutdown, so it may run twice.
+        """
+        if self._closed:
+            return
+        self._closed = True
+
+        self._write_q.join()
+        self._write_q.put((None, None))
+        self._writer_thread.join(timeout=5)
         try:
-            self.balance_history.to_csv(PAPER_BALANCE_CSV, index=False)
-        except Exception as e:
-            cprint(f"❌ Error saving balance: {e}", "red")
+            self._trades_fh.close()
+        except Exception:
+            pass
+
+        # Final snapshots so the next startup loads parquet, not CSV
+        _snapshot_parquet(PAPER_TRADES_PARQUET, self._trades_rows, TRADE_COLUMNS)
+        _snapshot_parquet(PAPER_POSITIONS_PARQUET, list(self._positions.values()), POSITION_COLUMNS)
     
-    def _recalculate_balance(self):
-        """Recalculate balance from trade history"""
-        if self.trades_df.empty:
-            self.balance = self.starting_balance
-            return
-        
-        # Calculate realized P&L from closed trades
-        closed_trades = self.trades_df[self.trades_df['status'] == 'CLOSED']
-        realized_pnl = closed_trades['pnl'].sum() if not closed_trades.empty else 0
-        
-        # Calculate unrealized P&L from open positions
-        unrealized_pnl = self.positions_df['unrealized_pnl'].sum() if not self.positions_df.empty else 0
-        
-        self.balance = self.starting_balance + realized_pnl
-        total_pnl = realized_pnl + unrealized_pnl
-        
+    def _record_balance(self, now_iso: str = None):
+        """Refresh balance from the running P&L aggregates (O(1)) and snapshot it"""
+        self.balance = self.starting_balance + self._realized_pnl
+        total_pnl = self._realized_pnl + self._unrealized_pnl
+
         # Update balance history
         balance_update = {
-            'timestamp': datetime.now().isoformat(),
+            'timestamp': now_iso or _now().isoformat(),
             'balance': self.balance,
             'total_pnl': total_pnl
         }
         
-        self.balance_history = pd.concat([
-            self.balance_history,
-            pd.DataFrame([balance_update])
-        ], ignore_index=True)
-        
-        self._save_balance()
-    
+        self._balance_rows.append(balance_update)
+
+        self._save_balance(balance_update)
+
     def place_order(
         self,
         market_slug: str,
@@ -193,29 +417,45 @@ class PaperTradingEngine:
         Returns:
             Trade ID
         """
+        # Intern the repeated identifier strings - every trade/position row
+        # for the same market then shares one object instead of N copies,
+        # and row-filter equality checks hit the pointer fast path
+        market_slug = sys.intern(market_slug)
+        token_id = sys.intern(token_id)
+        side = sys.intern(side)
+        order_type = sys.intern(order_type)
+        market_title = self._intern_cache.setdefault(market_title, market_title)
+
         usd_value = price * size
-        
+
         # Check balance for BUY orders
         if side == "BUY" and usd_value > self.balance:
             cprint(f"❌ Insufficient balance: ${self.balance:.2f} < ${usd_value:.2f}", "red")
             return None
         
+        # One clock read per order - the same timestamp feeds the trade ID,
+        # the trade row, the position row and the balance snapshot
+        now = _now()
+        ts_iso = now.isoformat()
+
         # Generate trade ID
-        trade_id = f"PAPER_{datetime.now().strftime('%Y%m%d%H%M%S')}"
-        
-        cprint(f"\n📝 PAPER TRADE SIMULATED", "white", "on_yellow")
-        cprint(f"   Trade ID: {trade_id}", "cyan")
-        cprint(f"   Market: {market_title[:50]}...", "cyan")
-        cprint(f"   Side: {side}", "cyan")
-        cprint(f"   Price: ${price:.3f}", "cyan")
-        cprint(f"   Size: {size:.2f} shares", "cyan")
-        cprint(f"   Value: ${usd_value:.2f}", "yellow", attrs=['bold'])
-        if notes:
-            cprint(f"   Notes: {notes}", "white")
+        trade_id = f"PAPER_{now.strftime('%Y%m%d%H%M%S')}"
+        
+        if self.verbose:
+            cprint(f"\n📝 PAPER TRADE SIMULATED", "white", "on_yellow")
+            cprint(f"   Trade ID: {trade_id}", "cyan")
+            title = market_title if len(market_title) <= 50 else market_title[:47] + '...'
+            cprint(f"   Market: {title}", "cyan")
+            cprint(f"   Side: {side}", "cyan")
+            cprint(f"   Price: ${price:.3f}", "cyan")
+            cprint(f"   Size: {size:.2f} shares", "cyan")
+            cprint(f"   Value: ${usd_value:.2f}", "yellow", attrs=['bold'])
+            if notes:
+                cprint(f"   Notes: {notes}", "white")
         
         # Record trade
         trade = {
-            'timestamp': datetime.now().isoformat(),
+            'timestamp': ts_iso,
             'trade_id': trade_id,
             'market_slug': market_slug,
             'market_title': market_title,
@@ -230,12 +470,9 @@ class PaperTradingEngine:
             'notes': notes
         }
         
-        self.trades_df = pd.concat([
-            self.trades_df,
-            pd.DataFrame([trade])
-        ], ignore_index=True)
-        
-        self._save_trades()
+        self._trades_rows.append(trade)
+
+        self._append_trade(trade)
         
         # Update balance if BUY
         if side == "BUY":
@@ -243,16 +480,32 @@ class PaperTradingEngine:
         
         # Add to positions if BUY
         if side == "BUY":
-            self._add_position(market_slug, market_title, token_id, side, price, size, usd_value)
-        # Close position if SELL
+            self._add_position(market_slug, market_title, token_id, side, price, size, usd_value, now_iso=ts_iso)
+        # Close position if SELL - returns the realized delta so no
+        # recompute is needed here
         else:
             self._close_position(market_slug, token_id, price, size)
-        
-        self._recalculate_balance()
-        
-        cprint(f"✅ Paper trade recorded! New balance: ${self.balance:,.2f}", "green")
-        
+
+        self._record_balance(now_iso=ts_iso)
+
+        if self.verbose:
+            cprint(f"✅ Paper trade recorded! New balance: ${self.balance:,.2f}", "green")
+
         return trade_id
+
+    def place_order_batch(self, orders) -> list:
+        """Place a batch of orders with per-trade output suppressed
+
+        Each order is a (market_slug, market_title, token_id, side, price,
+        size) tuple, optionally followed by order_type and notes. Returns
+        the list of trade IDs (None entries for rejected orders).
+        """
+        was_verbose = self.verbose
+        self.verbose = False
+        try:
+            return [self.place_order(*order) for order in orders]
+        finally:
+            self.verbose = was_verbose
     
     def _add_position(
         self,
@@ -262,7 +515,8 @@ class PaperTradingEngine:
         side: str,
         entry_price: float,
         shares: float,
-        entry_value: float
+        entry_value: float,
+        now_iso: str = None
     ):
         """Add a new position"""
         position = {
@@ -276,70 +530,129 @@ class PaperTradingEngine:
             'entry_value': entry_value,
             'current_value': entry_value,
             'unrealized_pnl': 0,
-            'opened_at': datetime.now().isoformat()
+            'opened_at': now_iso or _now().isoformat()
         }
         
-        self.positions_df = pd.concat([
-            self.positions_df,
-            pd.DataFrame([position])
-        ], ignore_index=True)
-        
-        self._save_positions()
+        self._positions[(market_slug, token_id)] = position
+
+        # New rows just get appended - the full rewrite only runs when a
+        # position closes or prices are refreshed
+        self._write_q.put(('position', dict(position)))
     
-    def _close_position(self, market_slug: str, token_id: str, exit_price: float, shares: float):
-        """Close a position and calculate P&L"""
-        # Find matching position
-        mask = (self.positions_df['market_slug'] == market_slug) & \
-               (self.positions_df['token_id'] == token_id)
-        
-        if not self.positions_df[mask].empty:
-            position = self.positions_df[mask].iloc[0]
-            entry_price = position['entry_price']
+    def _close_position(self, market_slug: str, token_id: str,
+                        exit_price: float, shares: float) -> Optional[float]:
+        """Close a position, fold its P&L into the aggregates and return it"""
+        # O(1) lookup by the natural key
+        position = self._positions.pop((market_slug, token_id), None)
+        pnl = None
+
+        if position is not None:
             entry_value = position['entry_value']
-            
+
             # Calculate P&L
             exit_value = exit_price * shares
             pnl = exit_value - entry_value
-            
+
+            # The closed position's unrealized P&L leaves the aggregate;
+            # the realized side accrues per closed trade row below so the
+            # running value matches what rebuild_state re-derives on load
+            self._unrealized_pnl -= position['unrealized_pnl']
+
             # Update balance
             self.balance += exit_value
-            
-            # Update trade with P&L
-            # Find the original BUY trade
-            buy_trade_mask = (self.trades_df['market_slug'] == market_slug) & \
-                            (self.trades_df['token_id'] == token_id) & \
-                            (self.trades_df['side'] == 'BUY') & \
-                            (self.trades_df['status'] == 'OPEN')
-            
-            if not self.trades_df[buy_trade_mask].empty:
-                self.trades_df.loc[buy_trade_mask, 'status'] = 'CLOSED'
-                self.trades_df.loc[buy_trade_mask, 'pnl'] = pnl
+
+            # Update the original open BUY trade(s) with P&L
+            updated = False
+            for t in self._trades_rows:
+                if (t['market_slug'] == market_slug and t['token_id'] == token_id
+                        and t['side'] == 'BUY' and t['status'] == 'OPEN'):
+                    t['status'] = 'CLOSED'
+                    t['pnl'] = pnl
+                    self._count_closed_trade(pnl)
+                    updated = True
+
+            if updated:
                 self._save_trades()
-            
-            # Remove from positions
-            self.positions_df = self.positions_df[~mask]
+
             self._save_positions()
-            
-            cprint(f"💰 Position closed! P&L: ${pnl:+.2f}", "green" if pnl > 0 else "red")
-    
+
+            if self.verbose:
+                cprint(f"💰 Position closed! P&L: ${pnl:+.2f}", "green" if pnl > 0 else "red")
+
+        return pnl
+
+    def rebuild_state(self, trades_df: pd.DataFrame = None):
+        """Reseed the running aggregates from the full history (cold path)
+
+        Pure numpy over the trade columns, so cold-starting a large
+        history is bound by the file read plus a few array sums instead
+        of a Python loop. The hot paths never call this - they bump the
+        aggregates incrementally.
+        """
+        df = trades_df if trades_df is not None else self.trades_df
+
+        closed_mask = np.asarray(df['status'] == 'CLOSED')
+        closed_pnl = np.asarray(df['pnl'], dtype=np.float64)[closed_mask]
+        win_mask = closed_pnl > 0
+        loss_mask = closed_pnl < 0
+
+        self._realized_pnl = float(closed_pnl.sum())
+        self._n_closed = int(np.count_nonzero(closed_mask))
+        self._n_wins = int(np.count_nonzero(win_mask))
+        self._n_losses = int(np.count_nonzero(loss_mask))
+        self._sum_win_pnl = float(closed_pnl[win_mask].sum())
+        self._sum_loss_pnl = float(closed_pnl[loss_mask].sum())
+        self._unrealized_pnl = sum(
+            p['unrealized_pnl'] for p in self._positions.values())
+
+        self._record_balance()
+
+    def _count_closed_trade(self, pnl: float):
+        """Fold one closed trade row into the P&L aggregates and counters"""
+        self._realized_pnl += pnl
+        self._n_closed += 1
+        if pnl > 0:
+            self._n_wins += 1
+            self._sum_win_pnl += pnl
+        elif pnl < 0:
+            self._n_losses += 1
+            self._sum_loss_pnl += pnl
+
     def update_position_prices(self, market_slug: str, current_price: float):
         """Update current prices for a position to calculate unrealized P&L"""
-        mask = self.positions_df['market_slug'] == market_slug
-        
-        if not self.positions_df[mask].empty:
-            self.positions_df.loc[mask, 'current_price'] = current_price
-            self.positions_df.loc[mask, 'current_value'] = \
-                self.positions_df.loc[mask, 'shares'] * current_price
-            self.positions_df.loc[mask, 'unrealized_pnl'] = \
-                self.positions_df.loc[mask, 'current_value'] - self.positions_df.loc[mask, 'entry_value']
-            
+        updated = False
+        for p in self._positions.values():
+            if p['market_slug'] == market_slug:
+                p['current_price'] = current_price
+                p['current_value'] = p['shares'] * current_price
+                new_unrealized = p['current_value'] - p['entry_value']
+                self._unrealized_pnl += new_unrealized - p['unrealized_pnl']
+                p['unrealized_pnl'] = new_unrealized
+                updated = True
+
+        if updated:
             self._save_positions()
-    
+
+    def update_position_prices_bulk(self, prices: Dict[str, float]):
+        """Apply a batch of price updates {market_slug: price} in one pass with one save"""
+        updated = False
+        for p in self._positions.values():
+            price = prices.get(p['market_slug'])
+            if price is None:
+                continue
+            p['current_price'] = price
+            p['current_value'] = p['shares'] * price
+            new_unrealized = p['current_value'] - p['entry_value']
+            self._unrealized_pnl += new_unrealized - p['unrealized_pnl']
+            p['unrealized_pnl'] = new_unrealized
+            updated = True
+
+        if updated:
+            self._save_positions()
+
     def get_performance_summary(self) -> Dict:
-        """Get overall performance statistics"""
-        closed_trades = self.trades_df[self.trades_df['status'] == 'CLOSED']
-        
-        if closed_trades.empty:
+        """Get overall performance statistics - O(1) from the running counters"""
+        if self._n_closed == 0:
             return {
                 'total_trades': 0,
                 'winning_trades': 0,
@@ -351,54 +664,74 @@ class PaperTradingEngine:
                 'current_balance': self.balance,
                 'total_return': 0
             }
-        
-        winning = closed_trades[closed_trades['pnl'] > 0]
-        losing = closed_trades[closed_trades['pnl'] < 0]
-        
-        total_pnl = closed_trades['pnl'].sum()
+
+        total_pnl = self._sum_win_pnl + self._sum_loss_pnl
         total_return = ((self.balance - self.starting_balance) / self.starting_balance) * 100
-        
+
         return {
-            'total_trades': len(closed_trades),
-            'winning_trades': len(winning),
-            'losing_trades': len(losing),
-            'win_rate': (len(winning) / len(closed_trades)) * 100 if len(closed_trades) > 0 else 0,
+            'total_trades': self._n_closed,
+            'winning_trades': self._n_wins,
+            'losing_trades': self._n_losses,
+            'win_rate': (self._n_wins / self._n_closed) * 100,
             'total_pnl': total_pnl,
-            'avg_win': winning['pnl'].mean() if len(winning) > 0 else 0,
-            'avg_loss': losing['pnl'].mean() if len(losing) > 0 else 0,
+            'avg_win': self._sum_win_pnl / self._n_wins if self._n_wins else 0,
+            'avg_loss': self._sum_loss_pnl / self._n_losses if self._n_losses else 0,
             'current_balance': self.balance,
             'total_return': total_return
         }
     
     def print_performance(self):
-        """Pretty print performance statistics"""
+        """Pretty print performance statistics
+
+        Builds the whole report in one buffer and emits it with a single
+        stdout write - ~15 separate cprint calls each do their own print
+        and flush, which dominates when a dashboard re-prints every loop.
+        """
         stats = self.get_performance_summary()
-        
-        cprint("\n" + "="*80, "cyan")
-        cprint("📊 PAPER TRADING PERFORMANCE (SIMULATED)", "white", "on_cyan", attrs=['bold'])
-        cprint("="*80, "cyan")
-        cprint(f"💰 Starting Balance: ${self.starting_balance:,.2f}", "white")
-        cprint(f"💵 Current Balance:  ${stats['current_balance']:,.2f}", "green" if stats['current_balance'] > self.starting_balance else "red", attrs=['bold'])
-        cprint(f"📈 Total Return:     {stats['total_return']:+.2f}%", "green" if stats['total_return'] > 0 else "red", attrs=['bold'])
-        cprint(f"💸 Total P&L:        ${stats['total_pnl']:+,.2f}", "green" if stats['total_pnl'] > 0 else "red")
-        cprint("", "white")
-        cprint(f"📊 Total Trades:     {stats['total_trades']}", "white")
-        cprint(f"✅ Winning Trades:   {stats['winning_trades']}", "green")
-        cprint(f"❌ Losing Trades:    {stats['losing_trades']}", "red")
-        cprint(f"🎯 Win Rate:         {stats['win_rate']:.1f}%", "yellow")
-        cprint(f"💚 Avg Win:          ${stats['avg_win']:,.2f}", "green")
-        cprint(f"💔 Avg Loss:         ${stats['avg_loss']:,.2f}", "red")
-        cprint("", "white")
-        cprint(f"📂 Open Positions:   {len(self.positions_df)}", "cyan")
-        cprint("="*80 + "\n", "cyan")
+
+        buf = io.StringIO()
+
+        def line(text, color=None, bold=False, on=None):
+            if _COLORS_ENABLED:
+                codes = (_ANSI['bold'] if bold else '') + \
+                        (_ANSI[on] if on else '') + \
+                        (_ANSI[color] if color else '')
+                buf.write(f"{codes}{text}{_ANSI['reset']}\n")
+            else:
+                buf.write(text + "\n")
+
+        line("\n" + _SEP80, "cyan")
+        line("📊 PAPER TRADING PERFORMANCE (SIMULATED)", "white", bold=True, on="on_cyan")
+        line(_SEP80, "cyan")
+        line(f"💰 Starting Balance: ${self.starting_balance:,.2f}", "white")
+        line(f"💵 Current Balance:  ${stats['current_balance']:,.2f}", "green" if stats['current_balance'] > self.starting_balance else "red", bold=True)
+        line(f"📈 Total Return:     {stats['total_return']:+.2f}%", "green" if stats['total_return'] > 0 else "red", bold=True)
+        line(f"💸 Total P&L:        ${stats['total_pnl']:+,.2f}", "green" if stats['total_pnl'] > 0 else "red")
+        line("")
+        line(f"📊 Total Trades:     {stats['total_trades']}", "white")
+        line(f"✅ Winning Trades:   {stats['winning_trades']}", "green")
+        line(f"❌ Losing Trades:    {stats['losing_trades']}", "red")
+        line(f"🎯 Win Rate:         {stats['win_rate']:.1f}%", "yellow")
+        line(f"💚 Avg Win:          ${stats['avg_win']:,.2f}", "green")
+        line(f"💔 Avg Loss:         ${stats['avg_loss']:,.2f}", "red")
+        line("")
+        line(f"📂 Open Positions:   {len(self._positions)}", "cyan")
+        line(_SEP80 + "\n", "cyan")
+
+        sys.stdout.write(buf.getvalue())
+        sys.stdout.flush()
 
 
 # ==============================================================================
 # GLOBAL PAPER TRADING INSTANCE
 # ==============================================================================
 
-# Create global instance
+# Create global instance - close() on interpreter exit drains the write
+# queue and lands the final parquet snapshots, so a clean process exit
+# never drops trades still sitting behind the daemon writer thread
 paper_engine = PaperTradingEngine() if PAPER_TRADING_ENABLED else None
+if paper_engine is not None:
+    atexit.register(paper_engine.close)
 
 # ==============================================================================
 # EXAMPLE USAGE
@@ -406,7 +739,7 @@ paper_engine = PaperTradingEngine() if PAPER_TRADING_ENABLED else None
 
 if __name__ == "__main__":
     cprint("\n🌙 Moon Dev's Paper Trading Engine - Test Mode", "white", "on_blue")
-    cprint("="*80, "cyan")
+    cprint(_SEP80, "cyan")
     
     engine = PaperTradingEngine(starting_balance=10000)
     